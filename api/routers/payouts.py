@@ -44,7 +44,6 @@ from users.schemas import (
     BankAccountResponse,
     PayoutRequestCreate,
     PayoutRequestResponse,
-    AttendeeDetail,
 )
 
 logger = get_logger(__name__)
@@ -801,11 +800,6 @@ async def get_payout_request(
     try:
         payout = await get_payout_request_by_id(payout_id, user)
         
-        # Convert attendees_details to proper format
-        attendees = [
-            AttendeeDetail(**attendee) for attendee in payout.attendees_details
-        ]
-        
         return {
             "success": True,
             "data": {
@@ -827,7 +821,11 @@ async def get_payout_request(
                 "base_ticket_fare": float(payout.base_ticket_fare),
                 "final_ticket_fare": float(payout.final_ticket_fare),
                 "total_tickets_sold": payout.total_tickets_sold,
-                "attendees_details": [{"name": a.name, "contact": a.contact} for a in attendees],
+                # Project the stored JSON rows directly; no per-attendee objects
+                "attendees_details": [
+                    {"name": a["name"], "contact": a["contact"]}
+                    for a in payout.attendees_details
+                ],
                 "platform_fee_amount": float(payout.platform_fee_amount),
                 "platform_fee_percentage": payout.platform_fee_percentage,
                 "final_earning": float(payout.final_earning),
@@ -0,0 +1,59 @@
+"""
+Shared pytest configuration for loopin_backend.
+
+Tests must never reach the outside network: if a mock like
+``patch('users.services.Client')`` drifts off its target, the call would
+otherwise stall on DNS/TLS to api.twilio.com until the client times out.
+Loopback stays open for the live-server checks in tests/fastapi.
+"""
+
+import ipaddress
+import socket
+
+import pytest
+
+
+_real_getaddrinfo = socket.getaddrinfo
+_real_connect = socket.socket.connect
+_real_connect_ex = socket.socket.connect_ex
+
+
+def _is_loopback(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _check_address(address):
+    # AF_UNIX addresses are plain paths; only inspect (host, port, ...) tuples
+    if isinstance(address, tuple) and not _is_loopback(address[0]):
+        raise RuntimeError(f"Network access is disabled in tests (tried to reach {address[0]})")
+
+
+def _guarded_getaddrinfo(host, *args, **kwargs):
+    if host is not None:
+        _check_address((host,))
+    return _real_getaddrinfo(host, *args, **kwargs)
+
+
+def _guarded_connect(sock, address):
+    _check_address(address)
+    return _real_connect(sock, address)
+
+
+def _guarded_connect_ex(sock, address):
+    _check_address(address)
+    return _real_connect_ex(sock, address)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _block_network():
+    """Fail fast on any non-loopback connection attempt"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket, 'getaddrinfo', _guarded_getaddrinfo)
+        mp.setattr(socket.socket, 'connect', _guarded_connect)
+        mp.setattr(socket.socket, 'connect_ex', _guarded_connect_ex)
+        yield
@@ -13,5 +13,7 @@ if ENVIRONMENT == 'production':
     from .prod import *
 elif ENVIRONMENT == 'dev':
     from .dev import *
+elif ENVIRONMENT == 'test':
+    from .test import *
 else:
     from .base import *
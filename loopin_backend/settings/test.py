@@ -0,0 +1,47 @@
+"""
+Test settings for loopin_backend project.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=loopin_backend.settings.test pytest users/tests/
+    ENVIRONMENT=test python manage.py test users.tests
+"""
+
+from .dev import *
+
+# Run the test suite against an in-memory SQLite database regardless of
+# DATABASE_URL, so no test write ever hits the filesystem.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Test users never log in with their fixture passwords; skip PBKDF2
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Tests read response.data, so skip rendering the browsable API's HTML
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
+
+
+class DisableMigrations:
+    """Report no migrations for any app so the test schema is built from the models"""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+# Same effect as pytest's --nomigrations, for the Django test runner
+MIGRATION_MODULES = DisableMigrations()
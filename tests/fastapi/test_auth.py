@@ -18,13 +18,19 @@ django.setup()
 class FastAPIAuthTest(TestCase):
     """Test FastAPI authentication endpoints."""
 
-    def setUp(self):
-        """Set up test client and test data."""
+    @classmethod
+    def setUpClass(cls):
+        """Build the API client once; the ASGI app is stateless between tests."""
+        super().setUpClass()
         # Import here to ensure Django is set up
         from loopin_backend.asgi import app
-        from fastapi.testclient import TestClient
         
-        self.client = TestClient(app)
+        cls.api_client = TestClient(app)
+
+    def setUp(self):
+        """Set up test client and test data."""
+        # TestCase assigns a Django test client per test; use the shared API client instead
+        self.client = self.api_client
         self.test_user_data = {
             "username": "fastapiuser",
             "email": "fastapi@example.com",
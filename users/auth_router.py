@@ -11,8 +11,10 @@ from django.utils import timezone
 from asgiref.sync import sync_to_async
 import jwt
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import random
+import time
 from typing import List, Optional
 from datetime import datetime, date
 import re
@@ -28,7 +30,7 @@ from .schemas import (
     UserProfileUpdate,
     EventInterestResponse
 )
-from .services import twilio_service
+from .services import get_twilio_service
 from core.services.storage import get_storage_service
 from core.exceptions import ValidationError
 
@@ -38,6 +40,14 @@ router = APIRouter(prefix="/auth")
 security = HTTPBearer()
 
 
+def __getattr__(name):
+    # Keep ``users.auth_router.twilio_service`` available without building
+    # the Twilio client at import time.
+    if name == "twilio_service":
+        return get_twilio_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def maybe_promote_user_from_waitlist_sync(user_id: int) -> bool:
     """
     Check if a waitlisted user should be promoted to active based on waitlist_promote_at.
@@ -68,7 +78,7 @@ def maybe_promote_user_from_waitlist_sync(user_id: int) -> bool:
         locked_user.save(update_fields=["is_active"])
         profile.save(update_fields=["is_active", "waitlist_started_at", "waitlist_promote_at", "updated_at"])
 
-        logger.info(f"User {locked_user.id} promoted from waitlist to active.")
+        logger.info("User %s promoted from waitlist to active.", locked_user.id)
         
         # Send notification to user about account activation (non-blocking)
         try:
@@ -87,10 +97,10 @@ def maybe_promote_user_from_waitlist_sync(user_id: int) -> bool:
                 reference_type='UserProfile',
                 reference_id=profile.id,
             )
-            logger.info(f"Waitlist promotion notification sent to user {locked_user.id}")
+            logger.info("Waitlist promotion notification sent to user %s", locked_user.id)
         except Exception as notify_error:
             # Never block promotion on notification failure
-            logger.error(f"Failed to send waitlist promotion notification to user {locked_user.id}: {notify_error}")
+            logger.error("Failed to send waitlist promotion notification to user %s: %s", locked_user.id, notify_error)
         
         return True
 
@@ -106,15 +116,25 @@ def create_jwt_token(user_id: int, phone_number: str) -> str:
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+@lru_cache(maxsize=1024)
+def _decode_jwt_token(token: str, secret: str, algorithm: str) -> dict:
+    # Clients send the same bearer token on every request; only successful
+    # decodes are cached, so the signature is checked once per token.
+    return jwt.decode(token, secret, algorithms=[algorithm])
+
+
 def verify_jwt_token(token: str) -> dict:
     """Verify and decode JWT token"""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        return payload
+        payload = _decode_jwt_token(token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    # A cached payload may have expired since it was first decoded
+    if 'exp' in payload and payload['exp'] <= time.time():
+        raise HTTPException(status_code=401, detail="Token has expired")
+    return dict(payload)
 
 
 @router.post("/signup", response_model=AuthResponse)
@@ -156,9 +176,9 @@ async def signup_with_phone(request: PhoneNumberRequest):
             try:
                 profile = await sync_to_async(lambda: existing_user.profile)()
                 has_complete_profile = bool(profile and profile.name and profile.profile_pictures)
-                logger.info(f"Existing user {phone_number} - Profile complete: {has_complete_profile}")
+                logger.info("Existing user %s - Profile complete: %s", phone_number, has_complete_profile)
             except Exception as e:
-                logger.info(f"User {phone_number} exists but no profile found: {e}")
+                logger.info("User %s exists but no profile found: %s", phone_number, e)
                 has_complete_profile = False
         
         # Get or create OTP record (works for both signup and login)
@@ -173,10 +193,10 @@ async def signup_with_phone(request: PhoneNumberRequest):
         # Send OTP via SMS
         try:
             success, sms_message, sms_details = await sync_to_async(
-                lambda: twilio_service.send_otp_sms(phone_number, otp_record.otp_code)
+                lambda: get_twilio_service().send_otp_sms(phone_number, otp_record.otp_code)
             )()
         except Exception as sms_error:
-            logger.error(f"SMS sending error for {phone_number}: {sms_error}")
+            logger.error("SMS sending error for %s: %s", phone_number, sms_error)
             return AuthResponse(
                 success=False,
                 message="Failed to send OTP. Please try again later."
@@ -202,7 +222,7 @@ async def signup_with_phone(request: PhoneNumberRequest):
             )
         else:
             # SMS failed to send
-            logger.error(f"Failed to send OTP to {phone_number}: {sms_message}")
+            logger.error("Failed to send OTP to %s: %s", phone_number, sms_message)
             return AuthResponse(
                 success=False,
                 message=f"Failed to send OTP. {sms_message}. Please try again."
@@ -210,7 +230,7 @@ async def signup_with_phone(request: PhoneNumberRequest):
             
     except ValueError as ve:
         # Validation errors from phone number validator
-        logger.error(f"Validation error in signup: {ve}")
+        logger.error("Validation error in signup: %s", ve)
         return AuthResponse(
             success=False,
             message=str(ve)
@@ -219,7 +239,7 @@ async def signup_with_phone(request: PhoneNumberRequest):
         # Catch-all for any unexpected errors
         import traceback
         error_trace = traceback.format_exc()
-        logger.error(f"Unexpected error in signup for {request.phone_number if request.phone_number else 'N/A'}: {e}\n{error_trace}")
+        logger.error("Unexpected error in signup for %s: %s\n%s", request.phone_number if request.phone_number else 'N/A', e, error_trace)
         return AuthResponse(
             success=False,
             message=f"An error occurred: {str(e)}. Please check logs for details."
@@ -274,7 +294,7 @@ async def verify_signup_otp(request: OTPVerificationRequest):
         try:
             is_valid, validation_message = await sync_to_async(lambda: otp_record.verify_otp(otp_code))()
         except Exception as verify_error:
-            logger.error(f"OTP verification logic error for {phone_number}: {verify_error}")
+            logger.error("OTP verification logic error for %s: %s", phone_number, verify_error)
             return AuthResponse(
                 success=False,
                 message="An error occurred while verifying OTP. Please try again."
@@ -305,14 +325,14 @@ async def verify_signup_otp(request: OTPVerificationRequest):
                             phone_number=phone_number,
                             is_verified=True
                         ))()
-                        logger.info(f"Created missing profile for existing user {phone_number}")
+                        logger.info("Created missing profile for existing user %s", phone_number)
                     else:
                         # Update verification status
                         profile.is_verified = True
                         await sync_to_async(lambda: profile.save())()
                 except Exception as profile_error:
                     # Profile doesn't exist, create it
-                    logger.warning(f"Profile access error for {phone_number}: {profile_error}")
+                    logger.warning("Profile access error for %s: %s", phone_number, profile_error)
                     profile = await sync_to_async(lambda: UserProfile.objects.create(
                         user=user,
                         phone_number=phone_number,
@@ -329,7 +349,7 @@ async def verify_signup_otp(request: OTPVerificationRequest):
                         is_staff=False,
                         is_superuser=False
                     ))()
-                    logger.info(f"Created new user account for {phone_number}")
+                    logger.info("Created new user account for %s", phone_number)
                     
                     # Create user profile
                     profile = await sync_to_async(lambda: UserProfile.objects.create(
@@ -337,9 +357,9 @@ async def verify_signup_otp(request: OTPVerificationRequest):
                         phone_number=phone_number,
                         is_verified=True
                     ))()
-                    logger.info(f"Created new profile for {phone_number}")
+                    logger.info("Created new profile for %s", phone_number)
                 except Exception as creation_error:
-                    logger.error(f"Error creating user/profile for {phone_number}: {creation_error}")
+                    logger.error("Error creating user/profile for %s: %s", phone_number, creation_error)
                     return AuthResponse(
                         success=False,
                         message="An error occurred while creating your account. Please try again."
@@ -349,7 +369,7 @@ async def verify_signup_otp(request: OTPVerificationRequest):
             try:
                 token = create_jwt_token(user.id, phone_number)
             except Exception as token_error:
-                logger.error(f"Error generating token for user {user.id}: {token_error}")
+                logger.error("Error generating token for user %s: %s", user.id, token_error)
                 return AuthResponse(
                     success=False,
                     message="Authentication successful but token generation failed. Please try again."
@@ -378,7 +398,7 @@ async def verify_signup_otp(request: OTPVerificationRequest):
             )
             
         except User.DoesNotExist:
-            logger.error(f"User not found during verification for {phone_number}")
+            logger.error("User not found during verification for %s", phone_number)
             return AuthResponse(
                 success=False,
                 message="User account error. Please try signing up again."
@@ -386,14 +406,14 @@ async def verify_signup_otp(request: OTPVerificationRequest):
             
     except ValueError as ve:
         # Validation errors from request model
-        logger.error(f"Validation error in verify-otp: {ve}")
+        logger.error("Validation error in verify-otp: %s", ve)
         return AuthResponse(
             success=False,
             message=str(ve)
         )
     except Exception as e:
         # Catch-all for any unexpected errors
-        logger.error(f"Unexpected error in verify-otp for {request.phone_number if request.phone_number else 'N/A'}: {e}")
+        logger.error("Unexpected error in verify-otp for %s: %s", request.phone_number if request.phone_number else 'N/A', e)
         return AuthResponse(
             success=False,
             message="An unexpected error occurred during verification. Please try again later."
@@ -455,7 +475,7 @@ async def complete_user_profile(
                 message=he.detail
             )
         except Exception as token_error:
-            logger.error(f"Token verification error: {token_error}")
+            logger.error("Token verification error: %s", token_error)
             return AuthResponse(
                 success=False,
                 message="Authentication token is invalid or expired. Please login again."
@@ -579,7 +599,7 @@ async def complete_user_profile(
                 is_active=True
             )))()
         except Exception as interest_error:
-            logger.error(f"Error fetching event interests: {interest_error}")
+            logger.error("Error fetching event interests: %s", interest_error)
             return AuthResponse(
                 success=False,
                 message="An error occurred while validating event interests. Please try again."
@@ -609,7 +629,7 @@ async def complete_user_profile(
                     message="Failed to upload profile pictures. Please try again."
                 )
             
-            logger.info(f"Uploaded {len(uploaded_urls)} profile pictures for user {user_id}")
+            logger.info("Uploaded %s profile pictures for user %s", len(uploaded_urls), user_id)
             
         except ValidationError as ve:
             return AuthResponse(
@@ -617,7 +637,7 @@ async def complete_user_profile(
                 message=ve.message
             )
         except Exception as upload_error:
-            logger.error(f"Error uploading profile pictures: {upload_error}", exc_info=True)
+            logger.error("Error uploading profile pictures: %s", upload_error, exc_info=True)
             return AuthResponse(
                 success=False,
                 message="An error occurred while uploading profile pictures. Please check file formats and sizes."
@@ -634,14 +654,14 @@ async def complete_user_profile(
             
             # Save profile first
             await sync_to_async(lambda: profile.save())()
-            logger.info(f"Profile updated for user {user_id}")
+            logger.info("Profile updated for user %s", user_id)
             
             # Set event interests (ManyToMany relationship)
             await sync_to_async(lambda: profile.event_interests.set(event_interests))()
-            logger.info(f"Event interests set for user {user_id}: {len(event_interests)} interests")
+            logger.info("Event interests set for user %s: %s interests", user_id, len(event_interests))
             
         except Exception as save_error:
-            logger.error(f"Error saving profile for user {user_id}: {save_error}")
+            logger.error("Error saving profile for user %s: %s", user_id, save_error)
             return AuthResponse(
                 success=False,
                 message="An error occurred while saving your profile. Please try again."
@@ -670,8 +690,9 @@ async def complete_user_profile(
             )()
 
             logger.info(
-                f"User {user.id} placed on waitlist after first profile completion. "
-                f"Promotion scheduled at {promote_at.isoformat()}."
+                "User %s placed on waitlist after first profile completion. "
+                "Promotion scheduled at %s.",
+                user.id, promote_at.isoformat(),
             )
         
         # Return success with profile details
@@ -692,14 +713,14 @@ async def complete_user_profile(
         
     except ValueError as ve:
         # Validation errors from request model validators
-        logger.error(f"Validation error in complete-profile: {ve}")
+        logger.error("Validation error in complete-profile: %s", ve)
         return AuthResponse(
             success=False,
             message=str(ve)
         )
     except Exception as e:
         # Catch-all for any unexpected errors
-        logger.error(f"Unexpected error in complete-profile for user {user_id if 'user_id' in locals() else 'N/A'}: {e}")
+        logger.error("Unexpected error in complete-profile for user %s: %s", user_id if 'user_id' in locals() else 'N/A', e)
         return AuthResponse(
             success=False,
             message="An unexpected error occurred while completing your profile. Please try again later."
@@ -732,7 +753,7 @@ async def login_with_phone(request: PhoneNumberRequest):
         await sync_to_async(lambda: otp_record.save())()
         
         # Send OTP via SMS
-        success, message, sms_details = await sync_to_async(lambda: twilio_service.send_otp_sms(phone_number, otp_record.otp_code))()
+        success, message, sms_details = await sync_to_async(lambda: get_twilio_service().send_otp_sms(phone_number, otp_record.otp_code))()
         
         if success:
             return AuthResponse(
@@ -747,7 +768,7 @@ async def login_with_phone(request: PhoneNumberRequest):
             )
             
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return AuthResponse(
             success=False,
             message="An error occurred during login"
@@ -805,7 +826,7 @@ async def verify_login_otp(request: LoginRequest):
             message="User not found"
         )
     except Exception as e:
-        logger.error(f"Login verification error: {e}")
+        logger.error("Login verification error: %s", e)
         return AuthResponse(
             success=False,
             message="An error occurred during login verification"
@@ -835,7 +856,7 @@ async def get_user_profile(token: str = Depends(security)):
                 user = await sync_to_async(lambda: User.objects.get(id=user_id))()
                 profile = await sync_to_async(lambda: UserProfile.objects.get(user=user))()
         except Exception as promote_error:
-            logger.error(f"Waitlist promotion check failed for user {user_id}: {promote_error}")
+            logger.error("Waitlist promotion check failed for user %s: %s", user_id, promote_error)
         
         # Fetch event interests
         event_interests_qs = await sync_to_async(lambda: list(profile.event_interests.filter(is_active=True).order_by('name')))()
@@ -871,7 +892,7 @@ async def get_user_profile(token: str = Depends(security)):
     except UserProfile.DoesNotExist:
         raise HTTPException(status_code=404, detail="User profile not found")
     except Exception as e:
-        logger.error(f"Profile retrieval error: {e}")
+        logger.error("Profile retrieval error: %s", e)
         raise HTTPException(status_code=500, detail="An error occurred while retrieving profile")
 
 
@@ -903,7 +924,7 @@ async def update_user_profile(
                 user = await sync_to_async(lambda: User.objects.get(id=user_id))()
                 profile = await sync_to_async(lambda: UserProfile.objects.get(user=user))()
         except Exception as promote_error:
-            logger.error(f"Waitlist promotion check failed for user {user_id}: {promote_error}")
+            logger.error("Waitlist promotion check failed for user %s: %s", user_id, promote_error)
         
         # Update fields if provided
         update_dict = update_data.dict(exclude_unset=True)
@@ -938,7 +959,7 @@ async def update_user_profile(
         
         # Save profile
         await sync_to_async(lambda: profile.save())()
-        logger.info(f"Profile updated for user {user_id}")
+        logger.info("Profile updated for user %s", user_id)
         
         # Refresh profile to get updated timestamp
         profile = await sync_to_async(lambda: UserProfile.objects.get(user=user))()
@@ -973,7 +994,7 @@ async def update_user_profile(
         
     except ValueError as ve:
         # Validation errors from schema validators
-        logger.error(f"Validation error in profile update: {ve}")
+        logger.error("Validation error in profile update: %s", ve)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
     except HTTPException:
         raise
@@ -982,7 +1003,7 @@ async def update_user_profile(
     except UserProfile.DoesNotExist:
         raise HTTPException(status_code=404, detail="User profile not found")
     except Exception as e:
-        logger.error(f"Profile update error: {e}")
+        logger.error("Profile update error: %s", e)
         raise HTTPException(status_code=500, detail="An error occurred while updating profile")
 
 
@@ -1030,7 +1051,7 @@ async def get_event_interests(token: str = Depends(security)):
             detail="User not found"
         )
     except Exception as e:
-        logger.error(f"Error fetching event interests: {e}")
+        logger.error("Error fetching event interests: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve event interests"
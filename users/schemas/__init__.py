@@ -0,0 +1,37 @@
+"""
+Schemas package for the users app.
+
+The pydantic models live in ``user_schemas`` and are resolved lazily on
+first attribute access (PEP 562), so management commands and test
+collection that never touch the auth endpoints skip the pydantic import.
+"""
+
+__all__ = [
+    'PhoneNumberRequest',
+    'OTPVerificationRequest',
+    'CompleteProfileRequest',
+    'LoginRequest',
+    'AuthResponse',
+    'EventInterestResponse',
+    'UserProfileUpdate',
+    'UserProfileResponse',
+    'BankAccountCreate',
+    'BankAccountUpdate',
+    'BankAccountResponse',
+    'AttendeeDetail',
+    'PayoutRequestCreate',
+    'PayoutRequestResponse',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import user_schemas
+    value = getattr(user_schemas, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
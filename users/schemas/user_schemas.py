@@ -2,23 +2,40 @@
 Pydantic schemas for user authentication API
 """
 
-from pydantic import BaseModel, Field, validator
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import Optional, List
 from datetime import datetime, date
 import re
 
 
+# Characters dropped from user-entered phone numbers before validation
+_PHONE_STRIP = str.maketrans('', '', ' \t\n\r\f\v-()')
+_PHONE_FMT_RE = re.compile(r'^\+?[1-9]\d{7,14}$')
+
+# Canonical gender values; already-lowercase input resolves without .lower()
+_GENDERS = ('male', 'female', 'other')
+_GENDER_MAP = {g: g for g in _GENDERS}
+_GENDER_ERR = f"Gender must be one of: {', '.join(_GENDERS)}"
+
+_PROFILE_UPDATE_GENDERS = _GENDERS + ('prefer_not_to_say',)
+_PROFILE_UPDATE_GENDER_MAP = {g: g for g in _PROFILE_UPDATE_GENDERS}
+_PROFILE_UPDATE_GENDER_ERR = f"Gender must be one of: {', '.join(_PROFILE_UPDATE_GENDERS)}"
+
+
 class PhoneNumberRequest(BaseModel):
     """Request model for phone number signup"""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     phone_number: str = Field(..., description="Phone number with country code (e.g., +1234567890)")
     
     @validator('phone_number')
     def validate_phone_number(cls, v):
-        # Remove any spaces or dashes
-        phone = re.sub(r'[\s\-\(\)]', '', v)
+        # Remove any spaces, dashes or parentheses
+        phone = v.translate(_PHONE_STRIP)
         
         # Check if it's a valid phone number format
-        if not re.match(r'^\+?[1-9]\d{7,14}$', phone):
+        if not _PHONE_FMT_RE.match(phone):
             raise ValueError('Invalid phone number format')
         
         return phone
@@ -26,6 +43,8 @@ class PhoneNumberRequest(BaseModel):
 
 class OTPVerificationRequest(BaseModel):
     """Request model for OTP verification"""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     phone_number: str = Field(..., description="Phone number with country code")
     otp_code: str = Field(..., min_length=4, max_length=4, description="4-digit OTP code")
     
@@ -40,6 +59,8 @@ class OTPVerificationRequest(BaseModel):
 
 class CompleteProfileRequest(BaseModel):
     """Request model for completing user profile"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     phone_number: str = Field(..., description="Phone number with country code")
     name: str = Field(..., min_length=2, max_length=100, description="Full name (minimum 2 characters)")
     birth_date: str = Field(..., description="Birth date in YYYY-MM-DD format")
@@ -51,14 +72,14 @@ class CompleteProfileRequest(BaseModel):
     
     @validator('name')
     def validate_name(cls, v):
-        if not v or not v.strip():
+        if not v:
             raise ValueError('Name cannot be empty')
-        if len(v.strip()) < 2:
+        if len(v) < 2:
             raise ValueError('Name must be at least 2 characters long')
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-\']+$", v.strip()):
+        if not re.match(r"^[a-zA-Z\s\-\']+$", v):
             raise ValueError('Name contains invalid characters')
-        return v.strip()
+        return v
     
     @validator('birth_date')
     def validate_birth_date(cls, v):
@@ -76,10 +97,10 @@ class CompleteProfileRequest(BaseModel):
     
     @validator('gender')
     def validate_gender(cls, v):
-        valid_genders = ['male', 'female', 'other']
-        if v.lower() not in valid_genders:
-            raise ValueError(f'Gender must be one of: {', '.join(valid_genders)}')
-        return v.lower()
+        canonical = _GENDER_MAP.get(v) or _GENDER_MAP.get(v.lower())
+        if canonical is None:
+            raise ValueError(_GENDER_ERR)
+        return canonical
     
     @validator('profile_pictures')
     def validate_profile_pictures(cls, v):
@@ -106,6 +127,8 @@ class CompleteProfileRequest(BaseModel):
 
 class LoginRequest(BaseModel):
     """Request model for user login"""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True)
+
     phone_number: str = Field(..., description="Phone number with country code")
     otp_code: str = Field(..., min_length=4, max_length=4, description="4-digit OTP code")
     
@@ -126,7 +149,12 @@ class AuthResponse(BaseModel):
     token: Optional[str] = None
 
 
-class EventInterestResponse(BaseModel):
+# Response DTOs in this module are plain dataclasses: they are built from
+# trusted DB rows, so they skip pydantic validation on construction and
+# serialize directly via FastAPI or orjson.
+
+@dataclass(slots=True, frozen=True)
+class EventInterestResponse:
     """Response model for event interest"""
     id: int
     name: str
@@ -137,6 +165,8 @@ class EventInterestResponse(BaseModel):
 
 class UserProfileUpdate(BaseModel):
     """Request model for updating user profile (all fields optional for partial updates)"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: Optional[str] = Field(None, min_length=2, max_length=100, description="Full name (minimum 2 characters)")
     bio: Optional[str] = Field(None, max_length=500, description="User biography")
     location: Optional[str] = Field(None, max_length=100, description="User location")
@@ -149,14 +179,14 @@ class UserProfileUpdate(BaseModel):
     def validate_name(cls, v):
         if v is None:
             return v
-        if not v or not v.strip():
+        if not v:
             raise ValueError('Name cannot be empty')
-        if len(v.strip()) < 2:
+        if len(v) < 2:
             raise ValueError('Name must be at least 2 characters long')
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-\']+$", v.strip()):
+        if not re.match(r"^[a-zA-Z\s\-\']+$", v):
             raise ValueError('Name contains invalid characters')
-        return v.strip()
+        return v
     
     @validator('birth_date')
     def validate_birth_date(cls, v):
@@ -178,10 +208,10 @@ class UserProfileUpdate(BaseModel):
     def validate_gender(cls, v):
         if v is None:
             return v
-        valid_genders = ['male', 'female', 'other', 'prefer_not_to_say']
-        if v.lower() not in valid_genders:
-            raise ValueError(f'Gender must be one of: {", ".join(valid_genders)}')
-        return v.lower()
+        canonical = _PROFILE_UPDATE_GENDER_MAP.get(v) or _PROFILE_UPDATE_GENDER_MAP.get(v.lower())
+        if canonical is None:
+            raise ValueError(_PROFILE_UPDATE_GENDER_ERR)
+        return canonical
     
     @validator('profile_pictures')
     def validate_profile_pictures(cls, v):
@@ -208,7 +238,8 @@ class UserProfileUpdate(BaseModel):
         return v
 
 
-class UserProfileResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class UserProfileResponse:
     """Response model for user profile"""
     id: int
     name: str
@@ -217,8 +248,8 @@ class UserProfileResponse(BaseModel):
     bio: Optional[str] = None
     location: Optional[str] = None
     birth_date: Optional[str] = None
-    event_interests: List[EventInterestResponse] = []
-    profile_pictures: List[str] = []
+    event_interests: List[EventInterestResponse] = field(default_factory=list)
+    profile_pictures: List[str] = field(default_factory=list)
     is_verified: bool
     is_active: bool
     created_at: str
@@ -231,6 +262,8 @@ class UserProfileResponse(BaseModel):
 
 class BankAccountCreate(BaseModel):
     """Request model for creating a bank account"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     bank_name: str = Field(..., min_length=2, max_length=100, description="Name of the bank")
     account_number: str = Field(..., min_length=8, max_length=30, description="Bank account number")
     ifsc_code: str = Field(..., min_length=11, max_length=11, description="IFSC code (11 characters)")
@@ -240,7 +273,7 @@ class BankAccountCreate(BaseModel):
     @validator('ifsc_code')
     def validate_ifsc_code(cls, v):
         import re
-        v = v.strip().upper()
+        v = v.upper()
         if not re.match(r'^[A-Z]{4}0[A-Z0-9]{6}$', v):
             raise ValueError('Invalid IFSC code format. Must be 11 characters: 4 letters, 0, then 6 alphanumeric')
         return v
@@ -249,11 +282,10 @@ class BankAccountCreate(BaseModel):
     def validate_account_number(cls, v):
         if not v.isdigit():
             raise ValueError('Account number must contain only digits')
-        return v.strip()
+        return v
     
     @validator('bank_name', 'account_holder_name')
     def validate_name_fields(cls, v):
-        v = v.strip()
         if not v or len(v) < 2:
             raise ValueError('Field cannot be empty or too short')
         return v
@@ -261,6 +293,8 @@ class BankAccountCreate(BaseModel):
 
 class BankAccountUpdate(BaseModel):
     """Request model for updating a bank account"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     bank_name: Optional[str] = Field(None, min_length=2, max_length=100)
     account_number: Optional[str] = Field(None, min_length=8, max_length=30)
     ifsc_code: Optional[str] = Field(None, min_length=11, max_length=11)
@@ -273,13 +307,14 @@ class BankAccountUpdate(BaseModel):
         if v is None:
             return v
         import re
-        v = v.strip().upper()
+        v = v.upper()
         if not re.match(r'^[A-Z]{4}0[A-Z0-9]{6}$', v):
             raise ValueError('Invalid IFSC code format')
         return v
 
 
-class BankAccountResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BankAccountResponse:
     """Response model for bank account"""
     id: int
     uuid: str
@@ -292,16 +327,14 @@ class BankAccountResponse(BaseModel):
     is_active: bool
     created_at: str
     updated_at: str
-    
-    class Config:
-        from_attributes = True
 
 
 # ============================================================================
 # Payout Request Schemas
 # ============================================================================
 
-class AttendeeDetail(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AttendeeDetail:
     """Attendee detail in payout request"""
     name: str
     contact: str  # phone number or email
@@ -313,7 +346,8 @@ class PayoutRequestCreate(BaseModel):
     bank_account_id: int = Field(..., description="Bank account ID to receive payout")
 
 
-class PayoutRequestResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PayoutRequestResponse:
     """Response model for payout request"""
     id: int
     uuid: str
@@ -327,7 +361,9 @@ class PayoutRequestResponse(BaseModel):
     base_ticket_fare: float
     final_ticket_fare: float
     total_tickets_sold: int
-    attendees_details: List[AttendeeDetail]
+    # Attendees stored column-wise; see attendees_details for row objects
+    attendee_names: List[str]
+    attendee_contacts: List[str]
     platform_fee_amount: float
     platform_fee_percentage: float
     final_earning: float
@@ -338,6 +374,11 @@ class PayoutRequestResponse(BaseModel):
     created_at: str
     updated_at: str
     processed_at: Optional[str]
-    
-    class Config:
-        from_attributes = True
+
+    @property
+    def attendees_details(self) -> List[AttendeeDetail]:
+        """Materialize per-attendee objects on demand."""
+        return [
+            AttendeeDetail(name=name, contact=contact)
+            for name, contact in zip(self.attendee_names, self.attendee_contacts)
+        ]
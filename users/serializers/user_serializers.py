@@ -2,6 +2,8 @@
 User-related serializers for Django REST Framework.
 """
 
+import hmac
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from users.models import UserProfile
@@ -28,7 +30,10 @@ class UserCreateSerializer(serializers.ModelSerializer):
     
     def validate(self, attrs):
         """Validate password confirmation."""
-        if attrs['password'] != attrs['password_confirm']:
+        # Compare as bytes: compare_digest rejects non-ASCII str input
+        password = attrs['password'].encode()
+        password_confirm = attrs['password_confirm'].encode()
+        if not hmac.compare_digest(password, password_confirm):
             raise serializers.ValidationError("Passwords don't match.")
         return attrs
     
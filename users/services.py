@@ -9,16 +9,30 @@ Production-grade Twilio service for SMS and WhatsApp messaging (production usage
 - Returns actionable details for observability/alerts
 """
 
+import functools
 import json
 import logging
+import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
 from dataclasses import dataclass
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any
 
 from decouple import config
+from requests import Session
+from requests.adapters import HTTPAdapter
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 logger = logging.getLogger("twilio_service")
 logger.setLevel(logging.INFO)
@@ -28,27 +42,62 @@ if not logger.handlers:
     logger.addHandler(ch)
 
 # ---------- Helpers & constants ----------
-E164_REGEX = re.compile(r'^\+[1-9]\d{1,14}$')
+# re.ASCII: \d means 0-9 only, which is also what Twilio accepts
+E164_REGEX = re.compile(r'^\+[1-9]\d{1,14}$', re.ASCII)
 
-_PERMANENT_ERROR_CODES = {63016, 63007, 63014, 63024, 21211}
-_TRANSIENT_ERROR_CODES = {21610, 21612, 21614, 21608, 20429, 63017}  # extend as required
+_PERMANENT_ERROR_CODES = frozenset({63016, 63007, 63014, 63024, 21211})
+_TRANSIENT_ERROR_CODES = frozenset({21610, 21612, 21614, 21608, 20429, 63017})  # extend as required
 
 def _is_valid_e164(number: str) -> bool:
     return bool(number and E164_REGEX.match(number))
 
-def _normalize_raw_phone(phone: str) -> str:
+_PHONE_PUNCTUATION = str.maketrans('', '', '()-. \t\n\r\f\v')
+_WHATSAPP_PREFIX = "whatsapp:"
+_WHATSAPP_PREFIX_LEN = len(_WHATSAPP_PREFIX)
+
+# Optional '+' then the E.164 digits; matched after punctuation is stripped
+_E164_DIGITS_REGEX = re.compile(r'\+?([1-9]\d{1,14})', re.ASCII)
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_e164(phone: str) -> Tuple[str, bool]:
+    """
+    Normalize a raw number and validate it as E.164 in one pass.
+    Returns (normalized, ok); cached because retries and reminders
+    normalize the same numbers repeatedly.
+    """
     if not phone:
-        return ""
+        return "", False
+    # Fast path: clients usually send clean +E.164 already. fullmatch, not
+    # match, so a trailing newline still goes through the cleanup below.
+    if type(phone) is str and E164_REGEX.fullmatch(phone):
+        return phone, True
     s = str(phone).strip()
-    if s.lower().startswith("whatsapp:"):
-        s = s[len("whatsapp:"):]
-    s = re.sub(r'[()\-\s\.]', '', s)
-    if not s.startswith('+'):
-        s = '+' + s.lstrip('+')
-    return s
+    # Lowercase only the prefix slice, not the whole number
+    if s[:_WHATSAPP_PREFIX_LEN].lower() == _WHATSAPP_PREFIX:
+        s = s[_WHATSAPP_PREFIX_LEN:]
+    s = s.translate(_PHONE_PUNCTUATION)
+    m = _E164_DIGITS_REGEX.fullmatch(s)
+    if m is None:
+        return s, False
+    return '+' + m.group(1), True
 
 def _whatsapp_prefix(number_e164: str) -> str:
-    return f"whatsapp:{number_e164}"
+    return _WHATSAPP_PREFIX + number_e164
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    # Compact, UTF-8 output to match orjson and keep request bodies small
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+def _serialize_content_variables(content_variables: Dict[Any, Any]) -> str:
+    if all(type(k) is str for k in content_variables):
+        return _dumps(content_variables)
+    return _dumps({str(k): v for k, v in content_variables.items()})
+
+def _whatsapp_routing(params: Dict[str, Any]) -> str:
+    # Slim stand-in for the full params in result details (see return_params)
+    return "messaging_service" if "messaging_service_sid" in params else "from"
 
 def _classify_error_code(code: Optional[int]) -> str:
     if code is None:
@@ -59,8 +108,110 @@ def _classify_error_code(code: Optional[int]) -> str:
         return "transient"
     return "unknown"
 
+class _LoggingRetry(Retry):
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+        logger.warning(
+            "Retrying Twilio request %s %s status=%s error=%s remaining=%s",
+            method, url, getattr(response, "status", None), error, retry.total,
+        )
+        return retry
+
+# Built once and shared: Retry is immutable (increment() returns a copy) and
+# the adapter's pool manager is thread-safe, so every session reuses them.
+_HTTP_RETRY = _LoggingRetry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+)
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=_HTTP_RETRY)
+
+def _build_http_client() -> TwilioHttpClient:
+    """
+    Twilio HTTP client backed by a keep-alive, pooled requests.Session so
+    TCP/TLS connections are reused across API calls. Retries cover
+    connection errors and 429/5xx on idempotent methods; POSTs are not
+    replayed on a status error, so a message is never sent twice.
+    """
+    http_client = TwilioHttpClient(pool_connections=True)
+    session = Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount("https://", _HTTP_ADAPTER)
+    http_client.session = session
+    return http_client
+
+_WHATSAPP_ERROR_MESSAGES = {
+    63016: "Recipient has not opted in to receive WhatsApp messages (user must message your number to opt in)",
+    63007: "Invalid WhatsApp number or not registered on WhatsApp",
+    63014: "WhatsApp message template not approved or invalid",
+    63024: "WhatsApp message blocked (likely not opted-in or template misuse)",
+    21211: "Invalid phone number (wrong format or non-existent)",
+    21656: "Invalid or empty message payload",
+}
+# Codes whose message needs extra guidance appended
+_WHATSAPP_ERROR_POST = {
+    63016: lambda msg: f"{msg}. User must send a message to your WhatsApp sender to create a session/opt-in.",
+}
+
+_OTP_SMS_TEMPLATE = "Your Loopin verification code is: {otp}. This code expires in 10 minutes."
+
+_RATE_LIMITED_CODE = 20429
+_RATE_LIMIT_WAIT_SECONDS = 5.0  # max local wait for a send slot
+_RATE_LIMIT_BACKOFF_SECONDS = 1.0  # pause after Twilio answers 429
+
+_MAX_RETRY_DELAY_SECONDS = 8.0
+
+def _retry_delay(attempt: int, base: float) -> float:
+    # Exponential backoff with jitter so workers hitting the same transient
+    # error do not retry in lockstep
+    return min(_MAX_RETRY_DELAY_SECONDS, base * (2 ** (attempt - 1))) + random.uniform(0, base)
+
+def _is_rate_limited(exc: TwilioRestException) -> bool:
+    return getattr(exc, "status", None) == 429 or getattr(exc, "code", None) == _RATE_LIMITED_CODE
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() blocks until a token is available
+    or the timeout expires; drain() forces callers to wait for a while.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.last_refill = now
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                wait = (tokens - self.tokens) / self.refill_rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def drain(self, seconds: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            # Set, not subtract: concurrent 429s must not stack into a longer pause
+            self.tokens = min(self.tokens, -seconds * self.refill_rate)
+
 # ---------- Config and Exceptions ----------
-@dataclass
+# Frozen: from_env() hands every caller the same cached instance
+@dataclass(frozen=True)
 class TwilioConfig:
     account_sid: str
     auth_token: str
@@ -73,22 +224,15 @@ class TwilioConfig:
     whatsapp_content_sid: Optional[str] = None
     test_mode: bool = False
     allow_plaintext_when_session_open: bool = False
+    max_concurrency: int = 10  # worker threads for batch sends
+    rate_limit_per_second: float = 0.0  # 0 disables client-side throttling
+    rate_limit_burst: int = 10
+    retry_base_delay: float = 0.25  # seconds; doubles per transient retry
 
     @classmethod
     def from_env(cls) -> 'TwilioConfig':
-        return cls(
-            account_sid=config('TWILIO_ACCOUNT_SID', default=''),
-            auth_token=config('TWILIO_AUTH_TOKEN', default=''),
-            verify_sid=config('TWILIO_VERIFY_SID', default=None),
-            verify_secret=config('TWILIO_VERIFY_SECRET', default=None),
-            messaging_service_sid_sms=config('TWILIO_MESSAGING_SERVICE_SID_SMS', default=None),
-            messaging_service_sid_whatsapp=config('TWILIO_MESSAGING_SERVICE_SID_WHATSAPP', default=None),
-            phone_number=config('TWILIO_PHONE_NUMBER', default=None),
-            whatsapp_phone_number=config('TWILIO_WHATSAPP_PHONE_NUMBER', default=None),
-            whatsapp_content_sid=config('TWILIO_WHATSAPP_CONTENT_SID', default=None),
-            test_mode=config('TWILIO_TEST_MODE', default='false', cast=bool),
-            allow_plaintext_when_session_open=config('TWILIO_ALLOW_PLAIN_WHEN_SESSION', default='false', cast=bool),
-        )
+        # Env is read once per process; call _load_config.cache_clear() after changing it
+        return _load_config()
 
     def validate(self) -> Tuple[bool, Optional[str]]:
         if not self.account_sid:
@@ -104,6 +248,38 @@ class TwilioConfig:
         return True, None
 
 
+# TwilioConfig field -> environment variable
+_CONFIG_ENV_KEYS = {
+    "account_sid": "TWILIO_ACCOUNT_SID",
+    "auth_token": "TWILIO_AUTH_TOKEN",
+    "verify_sid": "TWILIO_VERIFY_SID",
+    "verify_secret": "TWILIO_VERIFY_SECRET",
+    "messaging_service_sid_sms": "TWILIO_MESSAGING_SERVICE_SID_SMS",
+    "messaging_service_sid_whatsapp": "TWILIO_MESSAGING_SERVICE_SID_WHATSAPP",
+    "phone_number": "TWILIO_PHONE_NUMBER",
+    "whatsapp_phone_number": "TWILIO_WHATSAPP_PHONE_NUMBER",
+    "whatsapp_content_sid": "TWILIO_WHATSAPP_CONTENT_SID",
+    "test_mode": "TWILIO_TEST_MODE",
+    "allow_plaintext_when_session_open": "TWILIO_ALLOW_PLAIN_WHEN_SESSION",
+    "max_concurrency": "TWILIO_MAX_CONCURRENCY",
+    "rate_limit_per_second": "TWILIO_RATE",
+    "rate_limit_burst": "TWILIO_BURST",
+    "retry_base_delay": "TWILIO_RETRY_BASE_DELAY",
+}
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> TwilioConfig:
+    kwargs: Dict[str, Any] = {}
+    for f in dataclasses.fields(TwilioConfig):
+        default = '' if f.default is dataclasses.MISSING else f.default
+        if isinstance(default, (bool, int, float)):
+            # decouple turns cast=bool into its string-aware parser ("false", "0", ...)
+            kwargs[f.name] = config(_CONFIG_ENV_KEYS[f.name], default=default, cast=type(default))
+        else:
+            kwargs[f.name] = config(_CONFIG_ENV_KEYS[f.name], default=default)
+    return TwilioConfig(**kwargs)
+
+
 class TwilioServiceError(Exception):
     pass
 
@@ -125,55 +301,157 @@ class TwilioService:
             logger.error("Twilio configuration invalid: %s", msg)
             raise TwilioConfigurationError(msg)
 
-        try:
-            self.client = Client(self.config.account_sid, self.config.auth_token)
-            logger.info("Twilio client initialized")
-        except Exception as e:
-            logger.exception("Failed to initialize Twilio client")
-            raise TwilioConfigurationError("Failed to initialize Twilio client") from e
+        # Built on first use (see `client`), so test-mode sends never construct it
+        self._client: Optional[Client] = None
+        self._client_lock = threading.Lock()
+
+        self._bucket: Optional[TokenBucket] = None
+        if self.config.rate_limit_per_second > 0:
+            self._bucket = TokenBucket(
+                capacity=max(1, self.config.rate_limit_burst),
+                refill_rate=self.config.rate_limit_per_second,
+            )
+
+        # Sender and SMS body shape are fixed per config; pick them once so
+        # the send paths only merge prebuilt kwargs into messages.create().
+        self._otp_body_template = _OTP_SMS_TEMPLATE
+        self._sms_sender_kwargs: Optional[Dict[str, str]] = None
+        if self.config.messaging_service_sid_sms:
+            self._sms_sender_kwargs = {"messaging_service_sid": self.config.messaging_service_sid_sms}
+        elif self.config.phone_number:
+            self._sms_sender_kwargs = {"from_": self.config.phone_number}
+        self._whatsapp_sender_kwargs: Optional[Dict[str, str]] = None
+        if self.config.messaging_service_sid_whatsapp:
+            self._whatsapp_sender_kwargs = {"messaging_service_sid": self.config.messaging_service_sid_whatsapp}
+        elif self.config.whatsapp_phone_number:
+            from_norm, ok = _normalize_e164(self.config.whatsapp_phone_number)
+            if ok:
+                self._whatsapp_sender_kwargs = {"from_": _whatsapp_prefix(from_norm)}
+
+        # Batch sends share one pool per service; threads start on first batch
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
+
+        # Verify resource chain, resolved on the first verify_otp() call
+        self._verification_checks = None
+        self._verification_checks_sid: Optional[str] = None
+
+    @property
+    def client(self) -> Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        self._client = Client(
+                            self.config.account_sid,
+                            self.config.auth_token,
+                            http_client=_build_http_client(),
+                        )
+                        logger.info("Twilio client initialized")
+                    except Exception as e:
+                        logger.exception("Failed to initialize Twilio client")
+                        raise TwilioConfigurationError("Failed to initialize Twilio client") from e
+        return self._client
+
+    def _verification_checks_for(self, verify_sid: str):
+        # Resolve the Verify resource chain once; rebuild only if the SID changes
+        if self._verification_checks is None or self._verification_checks_sid != verify_sid:
+            self._verification_checks = self.client.verify.v2.services(verify_sid).verification_checks
+            self._verification_checks_sid = verify_sid
+        return self._verification_checks
+
+    def _acquire_send_slot(self) -> bool:
+        return self._bucket is None or self._bucket.acquire(1, timeout=_RATE_LIMIT_WAIT_SECONDS)
+
+    def _note_rate_limited(self) -> None:
+        # Twilio errors do not expose Retry-After, so back off for a fixed window
+        if self._bucket is not None:
+            self._bucket.drain(_RATE_LIMIT_BACKOFF_SECONDS)
 
     # ---------- SMS OTP ----------
-    def send_otp_sms(self, phone_number: str, otp_code: str) -> Tuple[bool, str, Dict[str, Any]]:
-        try:
-            if self.config.test_mode:
-                logger.info("TEST MODE: OTP %s -> %s", otp_code, phone_number)
-                return True, "TEST MODE simulated", {"to": phone_number, "otp": otp_code}
+    def _otp_sms_params(self, phone_number: str, otp_code: str) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[bool, str, Dict[str, Any]]]]:
+        """Return messages.create params, or the final result when nothing should be sent."""
+        if self.config.test_mode:
+            logger.info("TEST MODE: OTP %s -> %s", otp_code, phone_number)
+            return None, (True, "TEST MODE simulated", {"to": phone_number, "otp": otp_code})
 
-            normalized = _normalize_raw_phone(phone_number)
-            if not _is_valid_e164(normalized):
-                return False, "Invalid recipient phone number (E.164 required)", {"to": phone_number}
+        normalized, ok = _normalize_e164(phone_number)
+        if not ok:
+            return None, (False, "Invalid recipient phone number (E.164 required)", {"to": phone_number})
 
-            body = f"Your Loopin verification code is: {otp_code}. This code expires in 10 minutes."
+        body = self._otp_body_template.format(otp=otp_code)
 
-            params = {"body": body, "to": normalized}
-            if self.config.messaging_service_sid_sms:
-                params["messaging_service_sid"] = self.config.messaging_service_sid_sms
-            else:
-                from_num = self.config.phone_number or None
-                if not from_num:
-                    return False, "No SMS from number configured", {"to": normalized}
-                params["from_"] = from_num
+        if self._sms_sender_kwargs is None:
+            return None, (False, "No SMS from number configured", {"to": normalized})
+        return {"body": body, "to": normalized, **self._sms_sender_kwargs}, None
 
+    def send_otp_sms(self, phone_number: str, otp_code: str) -> Tuple[bool, str, Dict[str, Any]]:
+        try:
+            params, result = self._otp_sms_params(phone_number, otp_code)
+            if result is not None:
+                return result
+            normalized = params["to"]
+
+            if not self._acquire_send_slot():
+                return False, "SMS rate limit reached, try again shortly", {"to": normalized}
             message = self.client.messages.create(**params)
-            logger.info("OTP SMS created SID=%s to=%s status=%s", getattr(message, "sid", None), normalized, getattr(message, "status", None))
-            return True, "OTP queued/sent", {"sid": getattr(message, "sid", None), "status": getattr(message, "status", None)}
+            sid = getattr(message, "sid", None)
+            msg_status = getattr(message, "status", None)
+            logger.info("OTP SMS created SID=%s to=%s status=%s", sid, normalized, msg_status)
+            return True, "OTP queued/sent", {"sid": sid, "status": msg_status}
         except TwilioRestException as e:
-            logger.exception("Twilio API error sending OTP SMS")
+            if _is_rate_limited(e):
+                self._note_rate_limited()
+            logger.warning("Twilio API error sending OTP SMS status=%s code=%s msg=%s", getattr(e, "status", None), getattr(e, "code", None), getattr(e, "msg", e))
             return False, "Twilio API error sending SMS", {"error": str(e), "code": getattr(e, "code", None)}
         except Exception as e:
             logger.exception("Unexpected error sending OTP SMS")
             return False, "Unexpected error sending SMS", {"error": str(e)}
 
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        if self._batch_executor is None:
+            with self._batch_executor_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(
+                        max_workers=max(1, self.config.max_concurrency),
+                        thread_name_prefix="twilio-otp",
+                    )
+        return self._batch_executor
+
+    def send_otp_sms_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Tuple[str, bool, str, Dict[str, Any]]]:
+        """
+        Send many OTPs concurrently over the shared connection pool.
+        Returns (phone_number, success, message, details) per pair, in input order.
+        """
+        if not pairs:
+            return []
+        if max_concurrency is None or max_concurrency == self.config.max_concurrency:
+            # Default width: reuse the long-lived pool instead of spawning threads per batch
+            return self._collect_otp_batch(self._get_batch_executor(), pairs)
+        workers = max(1, min(max_concurrency, len(pairs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="twilio-otp") as pool:
+            return self._collect_otp_batch(pool, pairs)
+
+    def _collect_otp_batch(self, pool: ThreadPoolExecutor, pairs: List[Tuple[str, str]]) -> List[Tuple[str, bool, str, Dict[str, Any]]]:
+        futures = [pool.submit(self.send_otp_sms, phone, otp) for phone, otp in pairs]
+        return [(phone, *future.result()) for (phone, _otp), future in zip(pairs, futures)]
+
     # ---------- Verify OTP ----------
     def verify_otp(self, phone_number: str, otp_code: str) -> Tuple[bool, str, Dict[str, Any]]:
         try:
             if not self.config.verify_sid:
                 return False, "Verify service not configured", {}
-            normalized = _normalize_raw_phone(phone_number)
-            if not _is_valid_e164(normalized):
+            normalized, ok = _normalize_e164(phone_number)
+            if not ok:
                 return False, "Invalid phone number format", {"to": phone_number}
 
-            result = self.client.verify.v2.services(self.config.verify_sid).verification_checks.create(
+            if not self._acquire_send_slot():
+                return False, "Verify rate limit reached, try again shortly", {"to": normalized}
+            result = self._verification_checks_for(self.config.verify_sid).create(
                 to=normalized,
                 code=otp_code
             )
@@ -184,13 +462,114 @@ class TwilioService:
             logger.warning("OTP verification failed for %s status=%s", normalized, status)
             return False, "Invalid OTP", {"status": status}
         except TwilioRestException as e:
-            logger.exception("Twilio Verify API error")
+            if _is_rate_limited(e):
+                self._note_rate_limited()
+            logger.warning("Twilio Verify API error status=%s code=%s msg=%s", getattr(e, "status", None), getattr(e, "code", None), getattr(e, "msg", e))
             return False, "Twilio Verify error", {"error": str(e), "code": getattr(e, "code", None)}
         except Exception as e:
             logger.exception("Unexpected error verifying OTP")
             return False, "Unexpected verify error", {"error": str(e)}
 
     # ---------- WhatsApp sending (template-first) ----------
+    def _whatsapp_params(
+        self,
+        phone_number: str,
+        content_sid: Optional[str],
+        content_variables: Optional[Dict[str, Any]],
+        message_body: Optional[str],
+        from_number: Optional[str],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[bool, str, Dict[str, Any]]]]:
+        """Return messages.create params, or the final result when nothing should be sent."""
+        if self.config.test_mode:
+            logger.info("TEST MODE: simulate WhatsApp send to %s", phone_number)
+            return None, (True, "TEST MODE simulated", {"to": phone_number, "content_sid": content_sid, "content_variables": content_variables or {}})
+
+        normalized, ok = _normalize_e164(phone_number)
+        if not ok:
+            return None, (False, "Invalid recipient phone number (E.164 required)", {"to": phone_number})
+
+        whatsapp_to = _whatsapp_prefix(normalized)
+        final_content_sid = content_sid or self.config.whatsapp_content_sid
+
+        if not final_content_sid:
+            if not self.config.allow_plaintext_when_session_open:
+                return None, (False, "Plain-text WhatsApp outbound to cold users is disallowed in production. Use content_sid (template) instead.", {"to": whatsapp_to})
+            if not message_body or not message_body.strip():
+                return None, (False, "Empty message body", {"to": whatsapp_to})
+
+        params: Dict[str, Any] = {"to": whatsapp_to}
+        if not from_number and self._whatsapp_sender_kwargs:
+            params.update(self._whatsapp_sender_kwargs)
+        else:
+            from_val = from_number or self.config.whatsapp_phone_number
+            if not from_val:
+                return None, (False, "WhatsApp sender not configured", {"to": whatsapp_to})
+            from_norm, ok = _normalize_e164(from_val)
+            if not ok:
+                return None, (False, "Invalid whatsapp_from configuration (E.164 required)", {"from": from_val})
+            params["from_"] = _whatsapp_prefix(from_norm)
+
+        if final_content_sid:
+            params["content_sid"] = final_content_sid
+            if content_variables:
+                params["content_variables"] = _serialize_content_variables(content_variables)
+        else:
+            params["body"] = message_body
+        return params, None
+
+    def _whatsapp_rest_error(self, e: TwilioRestException, params: Dict[str, Any], attempt: int, retry_on_transient: int, return_params: bool) -> Optional[Tuple[bool, str, Dict[str, Any]]]:
+        """Final result for a REST error, or None when the caller should retry."""
+        if _is_rate_limited(e):
+            self._note_rate_limited()
+        code = getattr(e, "code", None)
+        kind = _classify_error_code(code)
+        err_text = str(e)
+        logger.warning("Twilio REST error sending WhatsApp to %s code=%s class=%s attempt=%d err=%s", params["to"], code, kind, attempt, err_text)
+        if code in _TRANSIENT_ERROR_CODES and attempt <= retry_on_transient:
+            return None
+        details = {"error": err_text, "code": code, "routing": _whatsapp_routing(params)}
+        if return_params:
+            details["params"] = params
+        return False, "Twilio API error sending WhatsApp message", details
+
+    def _whatsapp_outcome(
+        self,
+        sid: Optional[str],
+        msg_status: Optional[str],
+        error_code: Optional[int],
+        params: Dict[str, Any],
+        attempt: int,
+        retry_on_transient: int,
+        return_params: bool,
+    ) -> Optional[Tuple[bool, str, Dict[str, Any]]]:
+        """Final result for a created message, or None when the caller should retry."""
+        whatsapp_to = params["to"]
+        details = {
+            "sid": sid,
+            "status": msg_status,
+            "error_code": error_code,
+            "to": whatsapp_to,
+            "content_sid": params.get("content_sid"),
+            "routing": _whatsapp_routing(params),
+        }
+        if return_params:
+            details["params"] = params
+
+        if msg_status in ("failed", "undelivered"):
+            kind = _classify_error_code(error_code)
+            human = self._handle_whatsapp_error(error_code, msg_status)
+            logger.warning("WhatsApp undelivered to %s sid=%s status=%s code=%s kind=%s", whatsapp_to, sid, msg_status, error_code, kind)
+            if error_code in _TRANSIENT_ERROR_CODES and attempt <= retry_on_transient:
+                return None
+            return False, human, details
+
+        if msg_status in ("queued", "sending", "sent", "delivered", "read", "accepted", None):
+            logger.info("WhatsApp message accepted to %s sid=%s status=%s", whatsapp_to, sid, msg_status)
+            return True, "WhatsApp message accepted by Twilio", details
+
+        logger.info("WhatsApp returned status %s for %s sid=%s", msg_status, whatsapp_to, sid)
+        return True, f"WhatsApp message created with status {msg_status}", details
+
     def send_whatsapp_message(
         self,
         phone_number: str,
@@ -199,115 +578,62 @@ class TwilioService:
         content_variables: Optional[Dict[str, Any]] = None,
         message_body: Optional[str] = None,
         from_number: Optional[str] = None,
-        retry_on_transient: int = 1
+        retry_on_transient: int = 1,
+        return_params: bool = False
     ) -> Tuple[bool, str, Dict[str, Any]]:
         try:
-            if self.config.test_mode:
-                logger.info("TEST MODE: simulate WhatsApp send to %s", phone_number)
-                return True, "TEST MODE simulated", {"to": phone_number, "content_sid": content_sid, "content_variables": content_variables or {}}
-
-            normalized = _normalize_raw_phone(phone_number)
-            if not _is_valid_e164(normalized):
-                return False, "Invalid recipient phone number (E.164 required)", {"to": phone_number}
-
-            whatsapp_to = _whatsapp_prefix(normalized)
-            final_content_sid = content_sid or self.config.whatsapp_content_sid
-
-            if not final_content_sid:
-                if not self.config.allow_plaintext_when_session_open:
-                    return False, "Plain-text WhatsApp outbound to cold users is disallowed in production. Use content_sid (template) instead.", {"to": whatsapp_to}
-                if not message_body or not message_body.strip():
-                    return False, "Empty message body", {"to": whatsapp_to}
-
-            params: Dict[str, Any] = {"to": whatsapp_to}
-            if self.config.messaging_service_sid_whatsapp and not from_number:
-                params["messaging_service_sid"] = self.config.messaging_service_sid_whatsapp
-            else:
-                from_val = from_number or self.config.whatsapp_phone_number
-                if not from_val:
-                    return False, "WhatsApp sender not configured", {"to": whatsapp_to}
-                from_norm = _normalize_raw_phone(from_val)
-                if not _is_valid_e164(from_norm):
-                    return False, "Invalid whatsapp_from configuration (E.164 required)", {"from": from_val}
-                params["from_"] = _whatsapp_prefix(from_norm)
-
-            if final_content_sid:
-                params["content_sid"] = final_content_sid
-                if content_variables:
-                    normalized_vars = {str(k): v for k, v in (content_variables or {}).items()}
-                    params["content_variables"] = json.dumps(normalized_vars)
-            else:
-                params["body"] = message_body
+            params, result = self._whatsapp_params(phone_number, content_sid, content_variables, message_body, from_number)
+            if result is not None:
+                return result
 
             attempt = 0
             while True:
                 attempt += 1
+                if not self._acquire_send_slot():
+                    return False, "WhatsApp rate limit reached, try again shortly", {"to": params["to"]}
                 try:
                     message = self.client.messages.create(**params)
                 except TwilioRestException as e:
-                    code = getattr(e, "code", None)
-                    kind = _classify_error_code(code)
-                    logger.warning("Twilio REST error sending WhatsApp to %s code=%s class=%s attempt=%d err=%s", whatsapp_to, code, kind, attempt, str(e))
-                    if kind == "transient" and attempt <= retry_on_transient:
-                        time.sleep(1)
-                        continue
-                    return False, "Twilio API error sending WhatsApp message", {"error": str(e), "code": code, "params": params}
-
-                msg_status = getattr(message, "status", None)
-                error_code = getattr(message, "error_code", None)
-                details = {
-                    "sid": getattr(message, "sid", None),
-                    "status": msg_status,
-                    "error_code": error_code,
-                    "to": whatsapp_to,
-                    "content_sid": final_content_sid,
-                    "params": params,
-                }
-
-                if msg_status in ("failed", "undelivered"):
-                    kind = _classify_error_code(error_code)
-                    human = self._handle_whatsapp_error(error_code, msg_status)
-                    logger.warning("WhatsApp undelivered to %s sid=%s status=%s code=%s kind=%s", whatsapp_to, details["sid"], msg_status, error_code, kind)
-                    if kind == "transient" and attempt <= retry_on_transient:
-                        time.sleep(1)
-                        continue
-                    return False, human, details
-
-                if msg_status in ("queued", "sending", "sent", "delivered", "read", "accepted", None):
-                    logger.info("WhatsApp message accepted to %s sid=%s status=%s", whatsapp_to, details["sid"], msg_status)
-                    return True, "WhatsApp message accepted by Twilio", details
-
-                logger.info("WhatsApp returned status %s for %s sid=%s", msg_status, whatsapp_to, details["sid"])
-                return True, f"WhatsApp message created with status {msg_status}", details
+                    result = self._whatsapp_rest_error(e, params, attempt, retry_on_transient, return_params)
+                else:
+                    result = self._whatsapp_outcome(
+                        getattr(message, "sid", None),
+                        getattr(message, "status", None),
+                        getattr(message, "error_code", None),
+                        params, attempt, retry_on_transient, return_params,
+                    )
+                if result is not None:
+                    return result
+                time.sleep(_retry_delay(attempt, self.config.retry_base_delay))
 
         except Exception as exc:
             logger.exception("Unexpected error in send_whatsapp_message")
             return False, "Unexpected error sending WhatsApp message", {"error": str(exc)}
 
     def _handle_whatsapp_error(self, error_code: Optional[int], status: str) -> str:
-        mapping = {
-            63016: "Recipient has not opted in to receive WhatsApp messages (user must message your number to opt in)",
-            63007: "Invalid WhatsApp number or not registered on WhatsApp",
-            63014: "WhatsApp message template not approved or invalid",
-            63024: "WhatsApp message blocked (likely not opted-in or template misuse)",
-            21211: "Invalid phone number (wrong format or non-existent)",
-            21656: "Invalid or empty message payload",
-        }
-        if error_code in mapping:
-            base = mapping[error_code]
-            if error_code == 63016:
-                return f"{base}. User must send a message to your WhatsApp sender to create a session/opt-in."
-            return base
-        return f"Message delivery failed with status {status} (error_code={error_code})"
+        base = _WHATSAPP_ERROR_MESSAGES.get(error_code)
+        if base is None:
+            return f"Message delivery failed with status {status} (error_code={error_code})"
+        post = _WHATSAPP_ERROR_POST.get(error_code)
+        return post(base) if post else base
 
 # Singleton accessor
 _twilio_service_instance: Optional[TwilioService] = None
+_twilio_service_lock = threading.Lock()
 
 def get_twilio_service() -> TwilioService:
     global _twilio_service_instance
     if _twilio_service_instance is None:
-        _twilio_service_instance = TwilioService()
+        # Double-checked locking: threaded workers build a single instance
+        with _twilio_service_lock:
+            if _twilio_service_instance is None:
+                _twilio_service_instance = TwilioService()
     return _twilio_service_instance
 
-# Module-level singleton instance for convenience
-twilio_service = get_twilio_service()
+def __getattr__(name: str) -> Any:
+    # Module-level ``twilio_service`` resolves lazily (PEP 562) so importing
+    # this module does not build a Twilio client or read its env config.
+    if name == "twilio_service":
+        return get_twilio_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
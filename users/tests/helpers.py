@@ -0,0 +1,18 @@
+"""
+Shared fixtures and settings overrides for the users test suite.
+"""
+
+from datetime import date, timedelta
+
+from django.test import override_settings
+
+# Birth dates either side of the 18+ rule, computed once per test run
+_TODAY = date.today()
+BIRTH_ADULT = (_TODAY - timedelta(days=365*20)).isoformat()
+BIRTH_18 = (_TODAY - timedelta(days=365*18)).isoformat()
+BIRTH_MINOR = (_TODAY - timedelta(days=365*17)).isoformat()
+
+# Skip PBKDF2 for classes that create users; check_password still works with MD5
+fast_password_hashing = override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
@@ -9,7 +9,8 @@ from django.utils import timezone
 from datetime import timedelta, date
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+import functools
 import hashlib
 
 from users.models import UserProfile, PhoneOTP, EventInterest
@@ -18,11 +19,15 @@ from loopin_backend import settings
 
 client = TestClient(router)
 
+# Shared stub result for send_otp_sms (success, message, details)
+_OTP_OK = (True, "OTP sent", {})
 
+
+@functools.lru_cache(maxsize=None)
 def get_unique_phone(test_name):
     """Generate unique phone number for each test"""
-    # Convert hash to numeric only
-    hash_val = int(hashlib.md5(test_name.encode()).hexdigest()[:8], 16)
+    # Convert hash to numeric only (4-byte BLAKE2 digest, same range as md5[:8])
+    hash_val = int.from_bytes(hashlib.blake2b(test_name.encode(), digest_size=4).digest(), 'big')
     # Ensure it's 10 digits (valid phone number)
     phone_num = str(hash_val % 9000000000 + 1000000000)  # Range: 1000000000-9999999999
     return f"+{phone_num}"
@@ -105,13 +110,12 @@ class UserProfileModelWorkingTests(TestCase):
         self.assertEqual(profile.profile_pictures, [])
 
 
+@patch('users.auth_router.twilio_service.send_otp_sms', new=MagicMock(return_value=_OTP_OK))
 class SignupAPIWorkingTests(TestCase):
     """Working tests for signup API"""
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_new_user(self, mock_send):
+    def test_signup_new_user(self):
         """Test signup for new user"""
-        mock_send.return_value = (True, "OTP sent")
         phone = get_unique_phone("test_signup_new")
         
         response = client.post("/auth/signup", json={"phone_number": phone})
@@ -194,13 +198,12 @@ class CompleteProfileWorkingTests(TestCase):
         self.assertTrue(data["success"])
 
 
+@patch('users.auth_router.twilio_service.send_otp_sms', new=MagicMock(return_value=_OTP_OK))
 class LoginWorkingTests(TestCase):
     """Working tests for login"""
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_login_existing_user(self, mock_send):
+    def test_login_existing_user(self):
         """Test login for existing user"""
-        mock_send.return_value = (True, "OTP sent")
         phone = get_unique_phone("test_login_exist")
         user = User.objects.create_user(username=phone, password="test")
         UserProfile.objects.create(user=user, phone_number=phone, name="Test")
@@ -3,92 +3,100 @@ Comprehensive Test Suite for User Authentication System
 Tests every single possibility and edge case
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from datetime import timedelta, date, datetime
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from unittest.mock import patch, MagicMock
 import jwt
-import hashlib
 
 from users.models import UserProfile, PhoneOTP, EventInterest
-from users.auth_router import router, create_jwt_token, verify_jwt_token
+from users.auth_router import (
+    router,
+    create_jwt_token,
+    verify_jwt_token,
+    maybe_promote_user_from_waitlist_sync,
+    get_event_interests,
+)
+from users.tests.helpers import BIRTH_18, BIRTH_ADULT, BIRTH_MINOR, fast_password_hashing
 from loopin_backend import settings
 
 client = TestClient(router)
 
 
-class PhoneOTPModelTests(TestCase):
-    """Test PhoneOTP model functionality"""
-    
-    def tearDown(self):
-        """Clean up after each test"""
-        PhoneOTP.objects.all().delete()
-    
-    def test_create_otp_with_auto_expiration(self):
-        """Test OTP creation with automatic expiration"""
-        otp = PhoneOTP.objects.create(phone_number="+1111111111", otp_code="1234")
-        self.assertIsNotNone(otp.expires_at)
-        self.assertFalse(otp.is_expired())
+def make_otp(**kwargs):
+    """Build an unsaved PhoneOTP with the expiry save() would normally set"""
+    kwargs.setdefault("otp_code", "1234")
+    kwargs.setdefault("expires_at", timezone.now() + timedelta(minutes=10))
+    return PhoneOTP(**kwargs)
+
+
+@patch.object(PhoneOTP, 'save')
+class PhoneOTPLogicTests(SimpleTestCase):
+    """Test PhoneOTP generation and verification logic without the database"""
     
-    def test_generate_otp_creates_4_digit_code(self):
+    def test_generate_otp_creates_4_digit_code(self, mock_save):
         """Test OTP generation creates 4-digit code"""
-        otp = PhoneOTP.objects.create(phone_number="+2222222222", otp_code="1234")
+        otp = make_otp(phone_number="+2222222222")
         otp.generate_otp()
         self.assertEqual(len(otp.otp_code), 4)
         self.assertTrue(otp.otp_code.isdigit())
     
-    def test_generate_otp_resets_attempts(self):
+    def test_generate_otp_resets_attempts(self, mock_save):
         """Test OTP generation resets attempt counter"""
-        otp = PhoneOTP.objects.create(phone_number="+3333333333", otp_code="1234", attempts=3)
+        otp = make_otp(phone_number="+3333333333", attempts=3)
         otp.generate_otp()
         self.assertEqual(otp.attempts, 0)
     
-    def test_generate_otp_sets_verification_false(self):
+    def test_generate_otp_sets_verification_false(self, mock_save):
         """Test OTP generation sets is_verified to False"""
-        otp = PhoneOTP.objects.create(phone_number="+4444444444", otp_code="1234", is_verified=True)
+        otp = make_otp(phone_number="+4444444444", is_verified=True)
         otp.generate_otp()
         self.assertFalse(otp.is_verified)
     
-    def test_verify_otp_success(self):
+    def test_verify_otp_success(self, mock_save):
         """Test successful OTP verification"""
-        otp = PhoneOTP.objects.create(phone_number="+5555555555", otp_code="1234")
+        otp = make_otp(phone_number="+5555555555")
         is_valid, message = otp.verify_otp("1234")
         self.assertTrue(is_valid)
         self.assertEqual(message, "OTP verified successfully")
         self.assertTrue(otp.is_verified)
+        mock_save.assert_called_once_with(update_fields=['is_verified', 'status', 'updated_at'])
     
-    def test_verify_otp_invalid_code(self):
+    def test_verify_otp_invalid_code(self, mock_save):
         """Test OTP verification with invalid code"""
-        otp = PhoneOTP.objects.create(phone_number="+6666666666", otp_code="1234")
+        otp = make_otp(phone_number="+6666666666")
         is_valid, message = otp.verify_otp("5678")
         self.assertFalse(is_valid)
         self.assertIn("Invalid OTP", message)
         self.assertEqual(otp.attempts, 1)
     
-    def test_verify_otp_expired(self):
+    def test_verify_otp_expired(self, mock_save):
         """Test OTP verification with expired code"""
-        otp = PhoneOTP.objects.create(
+        otp = make_otp(
             phone_number="+7777777777",
-            otp_code="1234",
             expires_at=timezone.now() - timedelta(minutes=1)
         )
         is_valid, message = otp.verify_otp("1234")
         self.assertFalse(is_valid)
         self.assertEqual(message, "OTP has expired")
+        self.assertEqual(otp.status, "expired")
     
-    def test_verify_otp_max_attempts_reached(self):
+    def test_verify_otp_max_attempts_reached(self, mock_save):
         """Test OTP verification when max attempts reached"""
-        otp = PhoneOTP.objects.create(phone_number="+8888888888", otp_code="1234", attempts=3)
+        otp = make_otp(phone_number="+8888888888", attempts=3)
         is_valid, message = otp.verify_otp("1234")
         self.assertFalse(is_valid)
         self.assertEqual(message, "Too many attempts. Please request a new OTP")
     
-    def test_verify_otp_attempts_increment(self):
+    def test_verify_otp_attempts_increment(self, mock_save):
         """Test OTP attempts increment on wrong code"""
-        otp = PhoneOTP.objects.create(phone_number="+9999999999", otp_code="1234")
+        otp = make_otp(phone_number="+9999999999")
         otp.verify_otp("0000")
         self.assertEqual(otp.attempts, 1)
         otp.verify_otp("0000")
@@ -96,25 +104,40 @@ class PhoneOTPModelTests(TestCase):
         otp.verify_otp("0000")
         self.assertEqual(otp.attempts, 3)
     
-    def test_verify_otp_remaining_attempts_message(self):
+    def test_verify_otp_remaining_attempts_message(self, mock_save):
         """Test remaining attempts message"""
-        otp = PhoneOTP.objects.create(phone_number="+1010101010", otp_code="1234")
+        otp = make_otp(phone_number="+1010101010")
         _, msg1 = otp.verify_otp("0000")
         self.assertIn("2 attempts remaining", msg1)
         _, msg2 = otp.verify_otp("0000")
         self.assertIn("1 attempts remaining", msg2)
+
+
+class PhoneOTPModelTests(TestCase):
+    """Test PhoneOTP persistence behaviour"""
+    
+    def test_create_otp_with_auto_expiration(self):
+        """Test OTP creation with automatic expiration"""
+        otp = PhoneOTP.objects.create(phone_number="+1111111111", otp_code="1234")
+        self.assertIsNotNone(otp.expires_at)
+        self.assertFalse(otp.is_expired())
     
     def test_otp_unique_phone_number(self):
         """Test phone number uniqueness constraint"""
         phone = "+1212121212"
         PhoneOTP.objects.create(phone_number=phone, otp_code="1234")
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             PhoneOTP.objects.create(phone_number=phone, otp_code="5678")
 
 
 class EventInterestModelTests(TestCase):
     """Test EventInterest model"""
     
+    @classmethod
+    def setUpTestData(cls):
+        EventInterest.objects.create(name="Zebra")
+        EventInterest.objects.create(name="Apple")
+    
     def test_create_event_interest(self):
         """Test creating event interest"""
         interest = EventInterest.objects.create(
@@ -127,17 +150,16 @@ class EventInterestModelTests(TestCase):
     def test_event_interest_unique_name(self):
         """Test event interest name uniqueness"""
         EventInterest.objects.create(name="Music")
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             EventInterest.objects.create(name="Music")
     
     def test_event_interest_ordering(self):
         """Test event interests are ordered by name"""
-        EventInterest.objects.create(name="Zebra")
-        EventInterest.objects.create(name="Apple")
         interests = list(EventInterest.objects.all())
         self.assertEqual(interests[0].name, "Apple")
 
 
+@fast_password_hashing
 class UserProfileModelTests(TestCase):
     """Test UserProfile model"""
     
@@ -162,8 +184,10 @@ class UserProfileModelTests(TestCase):
     
     def test_user_profile_with_interests(self):
         """Test user profile with event interests"""
-        interest1 = EventInterest.objects.create(name="Music")
-        interest2 = EventInterest.objects.create(name="Sports")
+        interest1, interest2 = EventInterest.objects.bulk_create([
+            EventInterest(name="Music", slug="music"),
+            EventInterest(name="Sports", slug="sports"),
+        ])
         profile = UserProfile.objects.create(user=self.user)
         profile.event_interests.add(interest1, interest2)
         self.assertEqual(profile.event_interests.count(), 2)
@@ -177,14 +201,24 @@ class UserProfileModelTests(TestCase):
         self.assertEqual(profile.gender, 'male')
 
 
+@fast_password_hashing
 class SignupAPITests(TestCase):
     """Test signup endpoint - /auth/signup"""
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_new_user_success(self, mock_send):
+    @classmethod
+    def setUpClass(cls):
+        # One patcher for the class instead of a fresh MagicMock per test
+        patcher = patch('users.auth_router.twilio_service.send_otp_sms')
+        cls.mock_send = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
+    
+    def setUp(self):
+        self.mock_send.reset_mock()
+        self.mock_send.return_value = (True, "OTP sent", {})
+    
+    def test_signup_new_user_success(self):
         """Test successful signup for new user"""
-        mock_send.return_value = (True, "OTP sent")
-        
         response = client.post("/auth/signup", json={
             "phone_number": "+1234567890"
         })
@@ -195,8 +229,7 @@ class SignupAPITests(TestCase):
         self.assertIn("OTP sent successfully", data["message"])
         self.assertEqual(data["data"]["phone_number"], "+1234567890")
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_existing_complete_user(self, mock_send):
+    def test_signup_existing_complete_user(self):
         """Test signup for existing user with complete profile"""
         # Create existing user with complete profile
         user = User.objects.create_user(username="+1234567890", password="test")
@@ -215,10 +248,8 @@ class SignupAPITests(TestCase):
         self.assertFalse(data["success"])
         self.assertIn("already exists", data["message"].lower())
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_existing_incomplete_user(self, mock_send):
+    def test_signup_existing_incomplete_user(self):
         """Test signup for existing user with incomplete profile"""
-        mock_send.return_value = (True, "OTP sent")
         user = User.objects.create_user(username="+1234567890", password="test")
         UserProfile.objects.create(user=user, phone_number="+1234567890")
         
@@ -239,19 +270,16 @@ class SignupAPITests(TestCase):
     
     def test_signup_phone_with_spaces(self):
         """Test signup with phone containing spaces"""
-        with patch('users.auth_router.twilio_service.send_otp_sms') as mock:
-            mock.return_value = (True, "OTP sent")
-            response = client.post("/auth/signup", json={
-                "phone_number": "+1 (234) 567-8900"
-            })
-            data = response.json()
-            # Should normalize to +12345678900
-            self.assertTrue(data["success"])
-    
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_twilio_failure(self, mock_send):
+        response = client.post("/auth/signup", json={
+            "phone_number": "+1 (234) 567-8900"
+        })
+        data = response.json()
+        # Should normalize to +12345678900
+        self.assertTrue(data["success"])
+    
+    def test_signup_twilio_failure(self):
         """Test signup when Twilio SMS fails"""
-        mock_send.return_value = (False, "Twilio error")
+        self.mock_send.return_value = (False, "Twilio error", {})
         
         response = client.post("/auth/signup", json={
             "phone_number": "+1234567890"
@@ -261,11 +289,8 @@ class SignupAPITests(TestCase):
         self.assertFalse(data["success"])
         self.assertIn("Failed to send OTP", data["message"])
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_signup_creates_otp_record(self, mock_send):
+    def test_signup_creates_otp_record(self):
         """Test signup creates OTP record in database"""
-        mock_send.return_value = (True, "OTP sent")
-        
         client.post("/auth/signup", json={
             "phone_number": "+1234567890"
         })
@@ -275,16 +300,14 @@ class SignupAPITests(TestCase):
         self.assertEqual(len(otp.otp_code), 4)
 
 
+@fast_password_hashing
 class OTPVerificationAPITests(TestCase):
     """Test OTP verification endpoint - /auth/verify-otp"""
     
-    def setUp(self):
-        # Use unique phone number based on test method name
-        import hashlib
-        test_name = self._testMethodName
-        hash_suffix = hashlib.md5(test_name.encode()).hexdigest()[:8]
-        self.phone = f"+9{hash_suffix[:10]}"
-        self.otp = PhoneOTP.objects.create(phone_number=self.phone, otp_code="1234")
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+19000000001"
+        cls.otp = PhoneOTP.objects.create(phone_number=cls.phone, otp_code="1234")
     
     def tearDown(self):
         """Clean up after each test"""
@@ -328,8 +351,7 @@ class OTPVerificationAPITests(TestCase):
     
     def test_verify_otp_expired(self):
         """Test OTP verification with expired OTP"""
-        self.otp.expires_at = timezone.now() - timedelta(minutes=1)
-        self.otp.save()
+        PhoneOTP.objects.filter(pk=self.otp.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
         
         response = client.post("/auth/verify-otp", json={
             "phone_number": self.phone,
@@ -342,8 +364,7 @@ class OTPVerificationAPITests(TestCase):
     
     def test_verify_otp_max_attempts(self):
         """Test OTP verification after max attempts"""
-        self.otp.attempts = 3
-        self.otp.save()
+        PhoneOTP.objects.filter(pk=self.otp.pk).update(attempts=3)
         
         response = client.post("/auth/verify-otp", json={
             "phone_number": self.phone,
@@ -398,39 +419,32 @@ class OTPVerificationAPITests(TestCase):
         self.assertTrue(user.profile.is_verified)
 
 
+@fast_password_hashing
 class CompleteProfileAPITests(TestCase):
     """Test complete profile endpoint - /auth/complete-profile"""
     
-    def setUp(self):
-        # Use unique phone number based on test method name
-        test_name = self._testMethodName
-        hash_suffix = hashlib.md5(test_name.encode()).hexdigest()[:8]
-        self.phone = f"+7{hash_suffix[:10]}"
-        self.user = User.objects.create_user(username=self.phone, password="test")
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            phone_number=self.phone,
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+17000000001"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
+            phone_number=cls.phone,
             is_verified=True
         )
-        self.token = create_jwt_token(self.user.id, self.phone)
-        # Create unique interest names per test
-        self.interest1 = EventInterest.objects.create(name=f"Music-{hash_suffix}", is_active=True)
-        self.interest2 = EventInterest.objects.create(name=f"Sports-{hash_suffix}", is_active=True)
-    
-    def tearDown(self):
-        """Clean up after each test"""
-        EventInterest.objects.filter(name__contains=hashlib.md5(self._testMethodName.encode()).hexdigest()[:8]).delete()
-        User.objects.filter(username=self.phone).delete()
-    
-        # Birth date for 20-year-old
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
-        self.valid_profile_data = {
-            "phone_number": self.phone,
+        cls.token = create_jwt_token(cls.user.id, cls.phone)
+        cls.auth_header = {"Authorization": f"Bearer {cls.token}"}
+        cls.interest1, cls.interest2 = EventInterest.objects.bulk_create([
+            EventInterest(name="Music", slug="music", is_active=True),
+            EventInterest(name="Sports", slug="sports", is_active=True),
+        ])
+        # Tests derive variants with {**cls.valid_profile_data, ...} rather than mutating it
+        cls.valid_profile_data = {
+            "phone_number": cls.phone,
             "name": "John Doe",
-            "birth_date": birth_date,
+            "birth_date": BIRTH_ADULT,
             "gender": "male",
-            "event_interests": [self.interest1.id, self.interest2.id],
+            "event_interests": [cls.interest1.id, cls.interest2.id],
             "profile_pictures": ["http://example.com/pic1.jpg"],
             "bio": "Test bio",
             "location": "New York"
@@ -441,7 +455,7 @@ class CompleteProfileAPITests(TestCase):
         response = client.post(
             "/auth/complete-profile",
             json=self.valid_profile_data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         
         data = response.json()
@@ -449,9 +463,8 @@ class CompleteProfileAPITests(TestCase):
         self.assertEqual(data["data"]["name"], "John Doe")
         
         # Verify database
-        self.profile.refresh_from_db()
-        self.assertEqual(self.profile.name, "John Doe")
-        self.assertEqual(self.profile.gender, "male")
+        row = UserProfile.objects.filter(pk=self.profile.pk).values("name", "gender").get()
+        self.assertEqual(row, {"name": "John Doe", "gender": "male"})
     
     def test_complete_profile_invalid_token(self):
         """Test profile completion with invalid token"""
@@ -482,100 +495,92 @@ class CompleteProfileAPITests(TestCase):
     
     def test_complete_profile_name_too_short(self):
         """Test profile completion with name too short"""
-        data = self.valid_profile_data.copy()
-        data["name"] = "Ab"  # Only 2 characters
+        data = {**self.valid_profile_data, "name": "Ab"}  # Only 2 characters
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_name_with_numbers(self):
         """Test profile completion with numbers in name"""
-        data = self.valid_profile_data.copy()
-        data["name"] = "John123"
+        data = {**self.valid_profile_data, "name": "John123"}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_age_under_18(self):
         """Test profile completion with age under 18"""
-        data = self.valid_profile_data.copy()
         # 17 years old
-        data["birth_date"] = (date.today() - timedelta(days=365*17)).strftime('%Y-%m-%d')
+        data = {**self.valid_profile_data, "birth_date": BIRTH_MINOR}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_invalid_date_format(self):
         """Test profile completion with invalid date format"""
-        data = self.valid_profile_data.copy()
-        data["birth_date"] = "2000/01/01"  # Wrong format
+        data = {**self.valid_profile_data, "birth_date": "2000/01/01"}  # Wrong format
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_invalid_gender(self):
         """Test profile completion with invalid gender"""
-        data = self.valid_profile_data.copy()
-        data["gender"] = "unknown"
+        data = {**self.valid_profile_data, "gender": "unknown"}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_no_interests(self):
         """Test profile completion without event interests"""
-        data = self.valid_profile_data.copy()
-        data["event_interests"] = []
+        data = {**self.valid_profile_data, "event_interests": []}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_too_many_interests(self):
         """Test profile completion with too many interests"""
-        interests = [EventInterest.objects.create(name=f"Interest{i}", is_active=True).id for i in range(6)]
-        data = self.valid_profile_data.copy()
-        data["event_interests"] = interests
+        # The 1-5 bound is a length check, so the IDs need not exist
+        data = {**self.valid_profile_data, "event_interests": [1, 2, 3, 4, 5, 6]}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_inactive_interest(self):
         """Test profile completion with inactive event interest"""
         inactive_interest = EventInterest.objects.create(name="Inactive", is_active=False)
-        data = self.valid_profile_data.copy()
-        data["event_interests"] = [inactive_interest.id]
+        data = {**self.valid_profile_data, "event_interests": [inactive_interest.id]}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         
         data_response = response.json()
@@ -584,70 +589,77 @@ class CompleteProfileAPITests(TestCase):
     
     def test_complete_profile_no_pictures(self):
         """Test profile completion without pictures"""
-        data = self.valid_profile_data.copy()
-        data["profile_pictures"] = []
+        data = {**self.valid_profile_data, "profile_pictures": []}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_too_many_pictures(self):
         """Test profile completion with too many pictures"""
-        data = self.valid_profile_data.copy()
-        data["profile_pictures"] = [f"http://example.com/pic{i}.jpg" for i in range(7)]
+        data = {**self.valid_profile_data, "profile_pictures": [f"http://example.com/pic{i}.jpg" for i in range(7)]}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_invalid_picture_url(self):
         """Test profile completion with invalid picture URL"""
-        data = self.valid_profile_data.copy()
-        data["profile_pictures"] = ["not-a-url"]
+        data = {**self.valid_profile_data, "profile_pictures": ["not-a-url"]}
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
     
     def test_complete_profile_bio_too_long(self):
         """Test profile completion with bio exceeding max length"""
-        data = self.valid_profile_data.copy()
-        data["bio"] = "a" * 501  # Exceeds 500 char limit
+        data = {**self.valid_profile_data, "bio": "a" * 501}  # Exceeds 500 char limit
         
         response = client.post(
             "/auth/complete-profile",
             json=data,
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         self.assertEqual(response.status_code, 422)
 
 
+@fast_password_hashing
 class LoginAPITests(TestCase):
     """Test login endpoint - /auth/login"""
     
-    def setUp(self):
-        self.phone = "+1234567890"
-        self.user = User.objects.create_user(username=self.phone, password="test")
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            phone_number=self.phone,
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+1234567890"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
+            phone_number=cls.phone,
             name="Test User"
         )
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_login_existing_user_success(self, mock_send):
+    @classmethod
+    def setUpClass(cls):
+        # One patcher for the class instead of a fresh MagicMock per test
+        patcher = patch('users.auth_router.twilio_service.send_otp_sms')
+        cls.mock_send = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
+    
+    def setUp(self):
+        self.mock_send.reset_mock()
+        self.mock_send.return_value = (True, "OTP sent", {})
+    
+    def test_login_existing_user_success(self):
         """Test successful login for existing user"""
-        mock_send.return_value = (True, "OTP sent")
-        
         response = client.post("/auth/login", json={
             "phone_number": self.phone
         })
@@ -666,10 +678,9 @@ class LoginAPITests(TestCase):
         self.assertFalse(data["success"])
         self.assertIn("not found", data["message"].lower())
     
-    @patch('users.auth_router.twilio_service.send_otp_sms')
-    def test_login_twilio_failure(self, mock_send):
+    def test_login_twilio_failure(self):
         """Test login when Twilio fails"""
-        mock_send.return_value = (False, "SMS failed")
+        self.mock_send.return_value = (False, "SMS failed", {})
         
         response = client.post("/auth/login", json={
             "phone_number": self.phone
@@ -687,23 +698,21 @@ class LoginAPITests(TestCase):
         self.assertEqual(response.status_code, 422)
 
 
+@fast_password_hashing
 class VerifyLoginAPITests(TestCase):
     """Test verify login endpoint - /auth/verify-login"""
     
-    def setUp(self):
-        # Use unique phone number based on test method name
-        import hashlib
-        test_name = self._testMethodName
-        hash_suffix = hashlib.md5(test_name.encode()).hexdigest()[:8]
-        self.phone = f"+8{hash_suffix[:10]}"
-        self.user = User.objects.create_user(username=self.phone, password="test")
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            phone_number=self.phone,
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+18000000001"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
+            phone_number=cls.phone,
             name="Test User",
             is_verified=True
         )
-        self.otp = PhoneOTP.objects.create(phone_number=self.phone, otp_code="1234")
+        cls.otp = PhoneOTP.objects.create(phone_number=cls.phone, otp_code="1234")
     
     def tearDown(self):
         """Clean up after each test"""
@@ -735,8 +744,7 @@ class VerifyLoginAPITests(TestCase):
     
     def test_verify_login_expired_otp(self):
         """Test login verification with expired OTP"""
-        self.otp.expires_at = timezone.now() - timedelta(minutes=1)
-        self.otp.save()
+        PhoneOTP.objects.filter(pk=self.otp.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
         
         response = client.post("/auth/verify-login", json={
             "phone_number": self.phone,
@@ -758,16 +766,18 @@ class VerifyLoginAPITests(TestCase):
         self.assertIn("No OTP found", data["message"])
 
 
+@fast_password_hashing
 class GetProfileAPITests(TestCase):
     """Test get profile endpoint - /auth/profile"""
     
-    def setUp(self):
-        self.phone = "+1234567890"
-        self.user = User.objects.create_user(username=self.phone, password="test")
-        self.interest = EventInterest.objects.create(name="Music", is_active=True)
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            phone_number=self.phone,
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+1234567890"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        cls.interest = EventInterest.objects.create(name="Music", is_active=True)
+        cls.profile = UserProfile.objects.create(
+            user=cls.user,
+            phone_number=cls.phone,
             name="Test User",
             gender="male",
             bio="Test bio",
@@ -775,14 +785,20 @@ class GetProfileAPITests(TestCase):
             birth_date=date(2000, 1, 1),
             is_verified=True
         )
-        self.profile.event_interests.add(self.interest)
-        self.token = create_jwt_token(self.user.id, self.phone)
+        cls.profile.event_interests.add(cls.interest)
+        cls.token = create_jwt_token(cls.user.id, cls.phone)
+        cls.auth_header = {"Authorization": f"Bearer {cls.token}"}
+    
+    def setUp(self):
+        # ContentType lookups are cached per process; start every test cold so
+        # the assertNumQueries counts below don't depend on test order.
+        ContentType.objects.clear_cache()
     
     def test_get_profile_success(self):
         """Test successful profile retrieval"""
         response = client.get(
             "/auth/profile",
-            headers={"Authorization": f"Bearer {self.token}"}
+            headers=self.auth_header
         )
         
         self.assertEqual(response.status_code, 200)
@@ -790,6 +806,13 @@ class GetProfileAPITests(TestCase):
         self.assertEqual(data["name"], "Test User")
         self.assertEqual(data["phone_number"], self.phone)
     
+    def test_waitlist_promotion_check_query_count(self):
+        """Test the per-request waitlist check stays at a fixed number of queries"""
+        # SAVEPOINT, locked user, locked profile, RELEASE SAVEPOINT
+        with self.assertNumQueries(4):
+            promoted = maybe_promote_user_from_waitlist_sync(self.user.id)
+        self.assertFalse(promoted)
+    
     def test_get_profile_invalid_token(self):
         """Test profile retrieval with invalid token"""
         response = client.get(
@@ -804,37 +827,48 @@ class GetProfileAPITests(TestCase):
         self.assertEqual(response.status_code, 403)
 
 
+@fast_password_hashing
 class GetEventInterestsAPITests(TestCase):
     """Test get event interests endpoint - /auth/event-interests"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+15000000001"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        token = create_jwt_token(cls.user.id, cls.phone)
+        cls.auth_header = {"Authorization": f"Bearer {token}"}
+        cls.credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        # Read-only rows shared by the whole class; inserted out of name order
+        EventInterest.objects.bulk_create([
+            EventInterest(name="Zebra", slug="zebra", is_active=True),
+            EventInterest(name="Apple", slug="apple", is_active=True),
+            EventInterest(name="Inactive", slug="inactive", is_active=False),
+        ])
+    
     def test_get_event_interests_success(self):
         """Test successful retrieval of event interests"""
-        EventInterest.objects.create(name="Music", is_active=True)
-        EventInterest.objects.create(name="Sports", is_active=True)
-        EventInterest.objects.create(name="Inactive", is_active=False)
-        
-        response = client.get("/auth/event-interests")
+        response = client.get("/auth/event-interests", headers=self.auth_header)
         
         data = response.json()
         self.assertTrue(data["success"])
         self.assertEqual(len(data["data"]), 2)  # Only active interests
     
-    def test_get_event_interests_empty(self):
+    # The remaining tests call the route handler directly; the request
+    # pipeline is covered by test_get_event_interests_success above.
+    
+    async def test_get_event_interests_empty(self):
         """Test retrieval when no event interests exist"""
-        response = client.get("/auth/event-interests")
+        await EventInterest.objects.all().adelete()
+        
+        data = await get_event_interests(self.credentials)
         
-        data = response.json()
         self.assertTrue(data["success"])
         self.assertEqual(len(data["data"]), 0)
     
-    def test_get_event_interests_ordering(self):
+    async def test_get_event_interests_ordering(self):
         """Test event interests are ordered by name"""
-        EventInterest.objects.create(name="Zebra", is_active=True)
-        EventInterest.objects.create(name="Apple", is_active=True)
+        data = await get_event_interests(self.credentials)
         
-        response = client.get("/auth/event-interests")
-        
-        data = response.json()
         self.assertEqual(data["data"][0]["name"], "Apple")
         self.assertEqual(data["data"][1]["name"], "Zebra")
 
@@ -854,6 +888,21 @@ class LogoutAPITests(TestCase):
 class JWTTokenTests(TestCase):
     """Test JWT token creation and verification"""
     
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.valid_token = create_jwt_token(1, "+1234567890")
+        cls.expired_token = jwt.encode(
+            {
+                'user_id': 1,
+                'phone_number': "+1234567890",
+                'exp': datetime(2020, 1, 2),
+                'iat': datetime(2020, 1, 1)
+            },
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM
+        )
+    
     def test_create_jwt_token(self):
         """Test JWT token creation"""
         token = create_jwt_token(1, "+1234567890")
@@ -865,24 +914,15 @@ class JWTTokenTests(TestCase):
     
     def test_verify_jwt_token_success(self):
         """Test JWT token verification success"""
-        token = create_jwt_token(1, "+1234567890")
-        payload = verify_jwt_token(token)
+        payload = verify_jwt_token(self.valid_token)
         
         self.assertEqual(payload['user_id'], 1)
         self.assertEqual(payload['phone_number'], "+1234567890")
     
     def test_verify_jwt_token_expired(self):
         """Test JWT token verification with expired token"""
-        payload = {
-            'user_id': 1,
-            'phone_number': "+1234567890",
-            'exp': datetime.utcnow() - timedelta(days=1),
-            'iat': datetime.utcnow()
-        }
-        expired_token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-        
         with self.assertRaises(HTTPException) as context:
-            verify_jwt_token(expired_token)
+            verify_jwt_token(self.expired_token)
         self.assertEqual(context.exception.status_code, 401)
     
     def test_verify_jwt_token_invalid(self):
@@ -890,25 +930,49 @@ class JWTTokenTests(TestCase):
         with self.assertRaises(HTTPException) as context:
             verify_jwt_token("invalid_token")
         self.assertEqual(context.exception.status_code, 401)
+    
+    def test_verify_jwt_token_cached_until_expiry(self):
+        """Test a reused token is decoded once and still rejected after it expires"""
+        token = create_jwt_token(2, "+1234567890")
+        with patch('users.auth_router.jwt.decode', wraps=jwt.decode) as mock_decode:
+            verify_jwt_token(token)
+            verify_jwt_token(token)
+        self.assertEqual(mock_decode.call_count, 1)
+        
+        expires = verify_jwt_token(token)['exp']
+        with patch('users.auth_router.time.time', return_value=expires + 1):
+            with self.assertRaises(HTTPException) as context:
+                verify_jwt_token(token)
+        self.assertEqual(context.exception.detail, "Token has expired")
 
 
+@fast_password_hashing
 class EdgeCaseTests(TestCase):
     """Test edge cases and boundary conditions"""
     
+    @classmethod
+    def setUpClass(cls):
+        patcher = patch(
+            'users.auth_router.twilio_service.send_otp_sms',
+            return_value=(True, "OTP sent", {})
+        )
+        cls.mock_send = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        super().setUpClass()
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.phone = "+16000000001"
+        cls.user = User.objects.create_user(username=cls.phone, password="test")
+        UserProfile.objects.create(user=cls.user, phone_number=cls.phone, is_verified=True)
+        cls.auth_header = {"Authorization": f"Bearer {create_jwt_token(cls.user.id, cls.phone)}"}
+        cls.interest = EventInterest.objects.create(name="Test", is_active=True)
+    
     def test_phone_number_international_formats(self):
-        """Test various international phone number formats"""
-        test_cases = [
-            "+1234567890",      # US format
-            "+441234567890",    # UK format
-            "+919876543210",    # India format
-            "+861234567890",    # China format
-        ]
-        
-        for phone in test_cases:
-            with patch('users.auth_router.twilio_service.send_otp_sms') as mock:
-                mock.return_value = (True, "OTP sent")
-                response = client.post("/auth/signup", json={"phone_number": phone})
-                self.assertEqual(response.status_code, 200)
+        """Test signup accepts an international phone number"""
+        # The format matrix lives in test_schemas.TestPhoneNumberRequest; this is the endpoint smoke test
+        response = client.post("/auth/signup", json={"phone_number": "+441234567890"})
+        self.assertEqual(response.status_code, 200)
     
     def test_concurrent_otp_requests(self):
         """Test handling of concurrent OTP requests for same phone"""
@@ -925,25 +989,18 @@ class EdgeCaseTests(TestCase):
     
     def test_profile_completion_boundary_values(self):
         """Test profile completion with boundary values"""
-        user = User.objects.create_user(username="+1234567890", password="test")
-        UserProfile.objects.create(user=user, phone_number="+1234567890", is_verified=True)
-        token = create_jwt_token(user.id, "+1234567890")
-        
         # Test with minimum values
-        interests = [EventInterest.objects.create(name="Test", is_active=True).id]
-        birth_date = (date.today() - timedelta(days=365*18)).strftime('%Y-%m-%d')
-        
         response = client.post(
             "/auth/complete-profile",
             json={
-                "phone_number": "+1234567890",
+                "phone_number": self.phone,
                 "name": "ABC",  # Minimum 3 chars
-                "birth_date": birth_date,  # Exactly 18 years
+                "birth_date": BIRTH_18,  # Exactly 18 years
                 "gender": "male",
-                "event_interests": interests,  # Minimum 1
+                "event_interests": [self.interest.id],  # Minimum 1
                 "profile_pictures": ["http://example.com/1.jpg"]  # Minimum 1
             },
-            headers={"Authorization": f"Bearer {token}"}
+            headers=self.auth_header
         )
         
         self.assertEqual(response.status_code, 200)
@@ -960,28 +1017,22 @@ class EdgeCaseTests(TestCase):
         ]
         
         for name, should_pass in test_cases:
-            user = User.objects.create_user(username=f"+123456789{len(test_cases)}", password="test")
-            UserProfile.objects.create(user=user, phone_number=user.username, is_verified=True)
-            token = create_jwt_token(user.id, user.username)
-            
-            interest = EventInterest.objects.create(name=f"Interest{len(test_cases)}", is_active=True)
-            birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-            
-            response = client.post(
-                "/auth/complete-profile",
-                json={
-                    "phone_number": user.username,
-                    "name": name,
-                    "birth_date": birth_date,
-                    "gender": "male",
-                    "event_interests": [interest.id],
-                    "profile_pictures": ["http://example.com/pic.jpg"]
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            
-            if should_pass:
-                self.assertEqual(response.status_code, 200, f"Failed for name: {name}")
-            else:
-                self.assertEqual(response.status_code, 422, f"Should fail for name: {name}")
+            with self.subTest(name=name):
+                response = client.post(
+                    "/auth/complete-profile",
+                    json={
+                        "phone_number": self.phone,
+                        "name": name,
+                        "birth_date": BIRTH_ADULT,
+                        "gender": "male",
+                        "event_interests": [self.interest.id],
+                        "profile_pictures": ["http://example.com/pic.jpg"]
+                    },
+                    headers=self.auth_header
+                )
+                
+                if should_pass:
+                    self.assertEqual(response.status_code, 200, f"Failed for name: {name}")
+                else:
+                    self.assertEqual(response.status_code, 422, f"Should fail for name: {name}")
 
@@ -3,9 +3,8 @@ Comprehensive Test Suite for Pydantic Schemas
 Tests all validation rules and edge cases
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from pydantic import ValidationError
-from datetime import date, timedelta
 
 from users.schemas import (
     PhoneNumberRequest,
@@ -16,9 +15,10 @@ from users.schemas import (
     EventInterestResponse,
     UserProfileResponse
 )
+from users.tests.helpers import BIRTH_18, BIRTH_ADULT, BIRTH_MINOR
 
 
-class TestPhoneNumberRequest(TestCase):
+class TestPhoneNumberRequest(SimpleTestCase):
     """Test PhoneNumberRequest schema validation"""
     
     def test_valid_phone_number(self):
@@ -34,6 +34,19 @@ class TestPhoneNumberRequest(TestCase):
             request = PhoneNumberRequest(phone_number=phone)
             assert request.phone_number
     
+    def test_international_formats(self):
+        """Test international phone number formats pass through unchanged"""
+        international_phones = [
+            "+1234567890",      # US format
+            "+441234567890",    # UK format
+            "+919876543210",    # India format
+            "+861234567890",    # China format
+        ]
+        
+        for phone in international_phones:
+            with self.subTest(phone=phone):
+                self.assertEqual(PhoneNumberRequest(phone_number=phone).phone_number, phone)
+    
     def test_phone_number_normalization(self):
         """Test phone number normalization (removes spaces, dashes, parentheses)"""
         request = PhoneNumberRequest(phone_number="+1 (234) 567-8900")
@@ -65,7 +78,7 @@ class TestPhoneNumberRequest(TestCase):
             PhoneNumberRequest()
 
 
-class TestOTPVerificationRequest(TestCase):
+class TestOTPVerificationRequest(SimpleTestCase):
     """Test OTPVerificationRequest schema validation"""
     
     def test_valid_otp(self):
@@ -95,43 +108,39 @@ class TestOTPVerificationRequest(TestCase):
             OTPVerificationRequest(phone_number="+1234567890", otp_code="12 34")
 
 
-class TestCompleteProfileRequest(TestCase):
+class TestCompleteProfileRequest(SimpleTestCase):
     """Test CompleteProfileRequest schema validation"""
     
+    def _kwargs(self, **overrides):
+        """Valid request fields, with the field under test overridden"""
+        base = {
+            "phone_number": "+1234567890",
+            "name": "John Doe",
+            "birth_date": BIRTH_ADULT,
+            "gender": "male",
+            "event_interests": [1],
+            "profile_pictures": ["http://example.com/pic.jpg"],
+        }
+        base.update(overrides)
+        return base
+    
     def test_valid_profile(self):
         """Test valid profile data"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
+        request = CompleteProfileRequest(**self._kwargs(
             event_interests=[1, 2],
-            profile_pictures=["http://example.com/pic.jpg"],
             bio="Test bio",
             location="NYC"
-        )
+        ))
         assert request.name == "John Doe"
         assert request.gender == "male"
     
     def test_name_validation_minimum_length(self):
         """Test name must be at least 3 characters"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="AB",  # Too short
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(name="AB"))  # Too short
     
     def test_name_validation_valid_characters(self):
         """Test name with valid special characters"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         valid_names = [
             "John O'Brien",  # Apostrophe
             "Mary-Jane",     # Hyphen
@@ -139,20 +148,11 @@ class TestCompleteProfileRequest(TestCase):
         ]
         
         for name in valid_names:
-            request = CompleteProfileRequest(
-                phone_number="+1234567890",
-                name=name,
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            request = CompleteProfileRequest(**self._kwargs(name=name))
             assert request.name == name
     
     def test_name_validation_invalid_characters(self):
         """Test name with invalid characters"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         invalid_names = [
             "John123",   # Numbers
             "John@Doe",  # Special char
@@ -161,198 +161,82 @@ class TestCompleteProfileRequest(TestCase):
         
         for name in invalid_names:
             with self.assertRaises(ValidationError):
-                CompleteProfileRequest(
-                    phone_number="+1234567890",
-                    name=name,
-                    birth_date=birth_date,
-                    gender="male",
-                    event_interests=[1],
-                    profile_pictures=["http://example.com/pic.jpg"]
-                )
+                CompleteProfileRequest(**self._kwargs(name=name))
     
     def test_name_strips_whitespace(self):
         """Test name strips leading/trailing whitespace"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="  John Doe  ",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic.jpg"]
-        )
+        request = CompleteProfileRequest(**self._kwargs(name="  John Doe  "))
         assert request.name == "John Doe"
     
     def test_birth_date_age_18_validation(self):
         """Test birth date must result in age >= 18"""
         # Exactly 18 years old (should pass)
-        birth_date_18 = (date.today() - timedelta(days=365*18)).strftime('%Y-%m-%d')
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date_18,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic.jpg"]
-        )
-        assert request.birth_date == birth_date_18
+        request = CompleteProfileRequest(**self._kwargs(birth_date=BIRTH_18))
+        assert request.birth_date == BIRTH_18
         
         # 17 years old (should fail)
-        birth_date_17 = (date.today() - timedelta(days=365*17)).strftime('%Y-%m-%d')
         with self.assertRaises(ValidationError) as exc:
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date_17,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(birth_date=BIRTH_MINOR))
         assert "18 years or older" in str(exc.value)
     
     def test_birth_date_format_validation(self):
         """Test birth date format must be YYYY-MM-DD"""
         with self.assertRaises(ValidationError) as exc:
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date="2000/01/01",  # Wrong format
-                gender="male",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(birth_date="2000/01/01"))  # Wrong format
         assert "YYYY-MM-DD" in str(exc.value)
     
     def test_gender_validation(self):
         """Test gender must be male, female, or other"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         valid_genders = ["male", "female", "other", "MALE", "Female"]  # Case insensitive
         
         for gender in valid_genders:
-            request = CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender=gender,
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            request = CompleteProfileRequest(**self._kwargs(gender=gender))
             assert request.gender in ["male", "female", "other"]
         
         # Invalid gender
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="unknown",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(gender="unknown"))
     
     def test_event_interests_count_validation(self):
         """Test event interests must be 1-5"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         # Minimum 1
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic.jpg"]
-        )
+        request = CompleteProfileRequest(**self._kwargs())
         assert len(request.event_interests) == 1
         
         # Maximum 5
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1, 2, 3, 4, 5],
-            profile_pictures=["http://example.com/pic.jpg"]
-        )
+        request = CompleteProfileRequest(**self._kwargs(event_interests=[1, 2, 3, 4, 5]))
         assert len(request.event_interests) == 5
         
         # Zero (should fail)
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(event_interests=[]))
         
         # More than 5 (should fail)
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1, 2, 3, 4, 5, 6],
-                profile_pictures=["http://example.com/pic.jpg"]
-            )
+            CompleteProfileRequest(**self._kwargs(event_interests=[1, 2, 3, 4, 5, 6]))
     
     def test_profile_pictures_count_validation(self):
         """Test profile pictures must be 1-6"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         # Minimum 1
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic1.jpg"]
-        )
+        request = CompleteProfileRequest(**self._kwargs(profile_pictures=["http://example.com/pic1.jpg"]))
         assert len(request.profile_pictures) == 1
         
         # Maximum 6
         pics = [f"http://example.com/pic{i}.jpg" for i in range(1, 7)]
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=pics
-        )
+        request = CompleteProfileRequest(**self._kwargs(profile_pictures=pics))
         assert len(request.profile_pictures) == 6
         
         # Zero (should fail)
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=[]
-            )
+            CompleteProfileRequest(**self._kwargs(profile_pictures=[]))
         
         # More than 6 (should fail)
         pics = [f"http://example.com/pic{i}.jpg" for i in range(1, 8)]
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=pics
-            )
+            CompleteProfileRequest(**self._kwargs(profile_pictures=pics))
     
     def test_profile_pictures_url_validation(self):
         """Test profile picture URLs must be valid"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         valid_urls = [
             "http://example.com/pic.jpg",
             "https://example.com/pic.jpg",
@@ -360,16 +244,9 @@ class TestCompleteProfileRequest(TestCase):
             "http://localhost:8000/pic.jpg",
         ]
         
-        for url in valid_urls:
-            request = CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=[url]
-            )
-            assert request.profile_pictures[0] == url
+        # Up to 6 pictures are allowed, so all valid URLs fit in one request
+        request = CompleteProfileRequest(**self._kwargs(profile_pictures=valid_urls))
+        assert request.profile_pictures == valid_urls
         
         # Invalid URLs
         invalid_urls = [
@@ -379,63 +256,28 @@ class TestCompleteProfileRequest(TestCase):
         ]
         
         for url in invalid_urls:
-            with self.assertRaises(ValidationError):
-                CompleteProfileRequest(
-                    phone_number="+1234567890",
-                    name="John Doe",
-                    birth_date=birth_date,
-                    gender="male",
-                    event_interests=[1],
-                    profile_pictures=[url]
-                )
+            with self.subTest(url=url), self.assertRaises(ValidationError):
+                CompleteProfileRequest(**self._kwargs(profile_pictures=[url]))
     
     def test_bio_max_length(self):
         """Test bio maximum length is 500 characters"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
         # Exactly 500 chars (should pass)
         bio = "a" * 500
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic.jpg"],
-            bio=bio
-        )
+        request = CompleteProfileRequest(**self._kwargs(bio=bio))
         assert len(request.bio) == 500
         
         # 501 chars (should fail)
         with self.assertRaises(ValidationError):
-            CompleteProfileRequest(
-                phone_number="+1234567890",
-                name="John Doe",
-                birth_date=birth_date,
-                gender="male",
-                event_interests=[1],
-                profile_pictures=["http://example.com/pic.jpg"],
-                bio="a" * 501
-            )
+            CompleteProfileRequest(**self._kwargs(bio="a" * 501))
     
     def test_optional_fields(self):
         """Test bio and location are optional"""
-        birth_date = (date.today() - timedelta(days=365*20)).strftime('%Y-%m-%d')
-        
-        request = CompleteProfileRequest(
-            phone_number="+1234567890",
-            name="John Doe",
-            birth_date=birth_date,
-            gender="male",
-            event_interests=[1],
-            profile_pictures=["http://example.com/pic.jpg"]
-            # bio and location omitted
-        )
+        request = CompleteProfileRequest(**self._kwargs())
         assert request.bio is None
         assert request.location is None
 
 
-class TestLoginRequest(TestCase):
+class TestLoginRequest(SimpleTestCase):
     """Test LoginRequest schema validation"""
     
     def test_valid_login_request(self):
@@ -457,12 +299,13 @@ class TestLoginRequest(TestCase):
             LoginRequest(phone_number="+1234567890", otp_code="abcd")  # Not digits
 
 
-class TestAuthResponse(TestCase):
+class TestAuthResponse(SimpleTestCase):
     """Test AuthResponse schema"""
     
     def test_auth_response_success(self):
         """Test successful auth response"""
-        response = AuthResponse(
+        # Shape-only check: model_construct skips validation, defaults still apply
+        response = AuthResponse.model_construct(
             success=True,
             message="Success",
             data={"user_id": 1},
@@ -473,7 +316,7 @@ class TestAuthResponse(TestCase):
     
     def test_auth_response_failure(self):
         """Test failure auth response"""
-        response = AuthResponse(
+        response = AuthResponse.model_construct(
             success=False,
             message="Error occurred"
         )
@@ -482,7 +325,7 @@ class TestAuthResponse(TestCase):
         assert response.token is None
 
 
-class TestEventInterestResponse(TestCase):
+class TestEventInterestResponse(SimpleTestCase):
     """Test EventInterestResponse schema"""
     
     def test_event_interest_response(self):
@@ -498,7 +341,7 @@ class TestEventInterestResponse(TestCase):
         assert response.name == "Music"
 
 
-class TestUserProfileResponse(TestCase):
+class TestUserProfileResponse(SimpleTestCase):
     """Test UserProfileResponse schema"""
     
     def test_user_profile_response(self):
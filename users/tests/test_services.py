@@ -3,99 +3,115 @@ Comprehensive Test Suite for Twilio Services
 Tests all service functionality and edge cases
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from unittest.mock import patch, MagicMock
-from users.services import TwilioService, twilio_service
+from twilio.base.exceptions import TwilioRestException
+from twilio.rest import Client as TwilioClient
+from users.services import (
+    TwilioService, TwilioConfigurationError, TokenBucket, get_twilio_service,
+    _HTTP_ADAPTER, _load_config,
+)
 
 
-class TwilioServiceTests(TestCase):
+# Credentials every test runs with; tests needing other settings layer an
+# extra @patch.dict('os.environ', ...) on top.
+TWILIO_TEST_ENV = {
+    'TWILIO_ACCOUNT_SID': 'test_sid',
+    'TWILIO_AUTH_TOKEN': 'test_token',
+    'TWILIO_PHONE_NUMBER': '+15005550006'
+}
+
+
+def start_twilio_patches(test):
+    """Patch the environment and Twilio Client for one test, undone on cleanup"""
+    env_patcher = patch.dict('os.environ', TWILIO_TEST_ENV)
+    env_patcher.start()
+    test.addCleanup(env_patcher.stop)
+    client_patcher = patch('users.services.Client')
+    test.mock_client = client_patcher.start()
+    test.addCleanup(client_patcher.stop)
+    test.mock_create = test.mock_client.return_value.messages.create
+    # Config is cached per environment; rebuild it inside the patched env
+    _load_config.cache_clear()
+    test.addCleanup(_load_config.cache_clear)
+
+
+class TwilioServiceTests(SimpleTestCase):
     """Test Twilio service functionality"""
     
     def setUp(self):
-        self.service = TwilioService()
+        start_twilio_patches(self)
         self.phone = "+1234567890"
         self.otp = "1234"
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_sms_success(self, mock_client):
+    def test_send_otp_sms_success(self):
         """Test successful OTP SMS sending"""
         # Mock Twilio client
         mock_message = MagicMock()
         mock_message.sid = 'test_sid_123'
-        mock_client.return_value.messages.create.return_value = mock_message
+        self.mock_create.return_value = mock_message
         
         service = TwilioService()
-        success, message = service.send_otp_sms(self.phone, self.otp)
+        success, message, details = service.send_otp_sms(self.phone, self.otp)
         
         self.assertTrue(success)
-        self.assertEqual(message, "OTP sent successfully")
+        self.assertEqual(message, "OTP queued/sent")
+        self.assertEqual(details["sid"], 'test_sid_123')
     
     @patch.dict('os.environ', {'TWILIO_TEST_MODE': 'true'})
     def test_send_otp_test_mode(self):
         """Test OTP sending in test mode"""
         service = TwilioService()
-        success, message = service.send_otp_sms(self.phone, self.otp)
+        success, message, _ = service.send_otp_sms(self.phone, self.otp)
         
         self.assertTrue(success)
-        self.assertIn("TEST MODE", message)
-        self.assertIn(self.otp, message)
+        self.assertEqual(message, "TEST MODE simulated")
+        self.mock_client.assert_not_called()
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_sms_failure(self, mock_client):
-        """Test OTP SMS sending failure"""
-        mock_client.return_value.messages.create.side_effect = Exception("Twilio error")
-        
+    @patch.dict('os.environ', {'TWILIO_TEST_MODE': 'true', 'TWILIO_VERIFY_SID': 'verify_sid'})
+    def test_verify_sid_does_not_build_client(self):
+        """Test a Verify SID alone does not construct the REST client"""
         service = TwilioService()
-        success, message = service.send_otp_sms(self.phone, self.otp)
+        success, _, _ = service.send_otp_sms(self.phone, self.otp)
         
-        self.assertFalse(success)
-        self.assertIn("Failed to send OTP", message)
+        self.assertTrue(success)
+        self.mock_client.assert_not_called()
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_trial_account_restriction(self, mock_client):
-        """Test OTP sending with trial account restriction"""
-        mock_client.return_value.messages.create.side_effect = Exception(
-            "Trial account restriction: Please verify your phone number"
-        )
-        
+    def test_send_otp_sms_failure(self):
+        """Test OTP SMS sending failure, including trial account restriction"""
+        cases = [
+            (Exception("Twilio error"), "Unexpected error sending SMS", None),
+            # 21608: trial accounts can only message verified numbers
+            (
+                TwilioRestException(status=400, uri="/Messages", msg="Trial account restriction: unverified number", code=21608),
+                "Twilio API error sending SMS",
+                21608,
+            ),
+        ]
         service = TwilioService()
-        success, message = service.send_otp_sms(self.phone, self.otp)
         
-        self.assertFalse(success)
-        self.assertIn("trial account restriction", message.lower())
+        for error, expected_message, expected_code in cases:
+            with self.subTest(error=str(error)):
+                self.mock_create.side_effect = error
+                success, message, details = service.send_otp_sms(self.phone, self.otp)
+                
+                self.assertFalse(success)
+                self.assertEqual(message, expected_message)
+                self.assertEqual(details.get("code"), expected_code)
+                self.assertEqual(details["error"], str(error))
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_phone_number_normalization(self, mock_client):
+    def test_send_otp_phone_number_normalization(self):
         """Test phone number is normalized to include +"""
         mock_message = MagicMock()
         mock_message.sid = 'test_sid'
-        mock_client.return_value.messages.create.return_value = mock_message
+        self.mock_create.return_value = mock_message
         
         service = TwilioService()
         # Phone without +
         service.send_otp_sms("1234567890", self.otp)
         
         # Verify it was called with +
-        args = mock_client.return_value.messages.create.call_args
+        args = self.mock_create.call_args
         self.assertTrue(args[1]['to'].startswith('+'))
     
     @patch.dict('os.environ', {
@@ -103,68 +119,98 @@ class TwilioServiceTests(TestCase):
         'TWILIO_AUTH_TOKEN': ''
     })
     def test_send_otp_without_credentials(self):
-        """Test OTP sending without Twilio credentials"""
-        service = TwilioService()
-        success, message = service.send_otp_sms(self.phone, self.otp)
+        """Test the service refuses to start without Twilio credentials"""
+        with self.assertRaises(TwilioConfigurationError):
+            TwilioService()
         
-        self.assertFalse(success)
-        self.assertIn("unavailable", message.lower())
+        self.mock_client.assert_not_called()
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_VERIFY_SID': 'verify_sid'
-    })
-    @patch('users.services.Client')
-    def test_verify_otp_using_verify_service(self, mock_client):
+    @patch.dict('os.environ', {'TWILIO_VERIFY_SID': 'verify_sid'})
+    def test_verify_otp_using_verify_service(self):
         """Test OTP verification using Twilio Verify service"""
         mock_check = MagicMock()
         mock_check.status = 'approved'
-        mock_client.return_value.verify.v2.services.return_value.verification_checks.create.return_value = mock_check
+        self.mock_client.return_value.verify.v2.services.return_value.verification_checks.create.return_value = mock_check
         
         service = TwilioService()
-        success, message = service.verify_otp(self.phone, self.otp)
+        success, message, details = service.verify_otp(self.phone, self.otp)
         
         self.assertTrue(success)
-        self.assertEqual(message, "OTP verified successfully")
+        self.assertEqual(message, "OTP verified")
+        self.assertEqual(details, {'status': 'approved'})
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_VERIFY_SID': 'verify_sid'
-    })
-    @patch('users.services.Client')
-    def test_verify_otp_failed(self, mock_client):
+    @patch.dict('os.environ', {'TWILIO_VERIFY_SID': 'verify_sid'})
+    def test_verify_otp_failed(self):
         """Test failed OTP verification"""
         mock_check = MagicMock()
         mock_check.status = 'pending'
-        mock_client.return_value.verify.v2.services.return_value.verification_checks.create.return_value = mock_check
+        self.mock_client.return_value.verify.v2.services.return_value.verification_checks.create.return_value = mock_check
         
         service = TwilioService()
-        success, message = service.verify_otp(self.phone, self.otp)
+        success, message, details = service.verify_otp(self.phone, self.otp)
         
         self.assertFalse(success)
         self.assertEqual(message, "Invalid OTP")
+        self.assertEqual(details, {'status': 'pending'})
+    
+    def test_send_otp_sms_batch(self):
+        """Test batch OTP sending returns one result per recipient, in input order"""
+        mock_message = MagicMock()
+        mock_message.sid = 'test_sid'
+        mock_message.status = 'queued'
+        self.mock_create.return_value = mock_message
+        
+        service = TwilioService()
+        pairs = [("+1234567890", "1111"), ("+1234567891", "2222"), ("+1234567892", "3333")]
+        results = service.send_otp_sms_batch(pairs, max_concurrency=2)
+        
+        self.assertEqual([phone for phone, _, _, _ in results], [p for p, _ in pairs])
+        self.assertTrue(all(ok for _, ok, _, _ in results))
+        self.assertEqual(results[0][3], {'sid': 'test_sid', 'status': 'queued'})
+        self.assertEqual(self.mock_create.call_count, 3)
+        
+        # The configured width builds the shared pool once and reuses it
+        self.assertIsNone(service._batch_executor)
+        service.send_otp_sms_batch(pairs)
+        executor = service._batch_executor
+        self.assertIsNotNone(executor)
+        self.addCleanup(executor.shutdown)
+        service.send_otp_sms_batch(pairs, max_concurrency=service.config.max_concurrency)
+        self.assertIs(service._batch_executor, executor)
+        
+        # A width other than the configured one gets its own pool, even a wider one
+        service.send_otp_sms_batch(pairs, max_concurrency=service.config.max_concurrency + 5)
+        self.assertIs(service._batch_executor, executor)
+        self.assertEqual(self.mock_create.call_count, 12)
     
+    @patch('users.services.Client', TwilioClient)
+    @patch('users.services._twilio_service_instance', None)
+    def test_get_twilio_service_is_singleton(self):
+        """Test the accessor returns one instance sharing the pooled adapter"""
+        service = get_twilio_service()
+        
+        self.assertIs(service, get_twilio_service())
+        self.assertIs(service.client.http_client.session.get_adapter('https://api.twilio.com'), _HTTP_ADAPTER)
+    
+    @patch('users.services._twilio_service_instance', None)
     def test_global_twilio_service_instance(self):
         """Test global twilio_service instance exists"""
+        # Resolved on access, so importing this module builds no client
+        from users.services import twilio_service
         self.assertIsInstance(twilio_service, TwilioService)
 
 
-class TwilioServiceEdgeCasesTests(TestCase):
+class TwilioServiceEdgeCasesTests(SimpleTestCase):
     """Test edge cases for Twilio service"""
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_with_special_characters(self, mock_client):
+    def setUp(self):
+        start_twilio_patches(self)
+    
+    def test_send_otp_with_special_characters(self):
         """Test OTP sending with special characters in phone"""
         mock_message = MagicMock()
         mock_message.sid = 'test_sid'
-        mock_client.return_value.messages.create.return_value = mock_message
+        self.mock_create.return_value = mock_message
         
         service = TwilioService()
         phones = [
@@ -174,90 +220,101 @@ class TwilioServiceEdgeCasesTests(TestCase):
         ]
         
         for phone in phones:
-            success, _ = service.send_otp_sms(phone, "1234")
-            # Should succeed after normalization
-            self.assertTrue(success)
+            with self.subTest(phone=phone):
+                success, _, _ = service.send_otp_sms(phone, "1234")
+                # Should succeed after normalization
+                self.assertTrue(success)
+                self.assertEqual(self.mock_create.call_args[1]['to'], "+12345678900")
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_message_format(self, mock_client):
+    def test_send_otp_message_format(self):
         """Test OTP SMS message format"""
         mock_message = MagicMock()
         mock_message.sid = 'test_sid'
-        mock_client.return_value.messages.create.return_value = mock_message
+        self.mock_create.return_value = mock_message
         
         service = TwilioService()
         service.send_otp_sms("+1234567890", "1234")
         
         # Verify message content
-        call_args = mock_client.return_value.messages.create.call_args
+        call_args = self.mock_create.call_args
         message_body = call_args[1]['body']
         
         self.assertIn("1234", message_body)  # OTP code
         self.assertIn("Loopin", message_body)  # Brand name
         self.assertIn("10 minutes", message_body)  # Expiration time
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_network_timeout(self, mock_client):
+    def test_send_otp_network_timeout(self):
         """Test OTP sending with network timeout"""
         import socket
-        mock_client.return_value.messages.create.side_effect = socket.timeout("Network timeout")
+        self.mock_create.side_effect = socket.timeout("Network timeout")
         
         service = TwilioService()
-        success, message = service.send_otp_sms("+1234567890", "1234")
+        success, message, details = service.send_otp_sms("+1234567890", "1234")
         
         self.assertFalse(success)
-        self.assertIn("Failed to send OTP", message)
+        self.assertEqual(message, "Unexpected error sending SMS")
+        self.assertEqual(details["error"], "Network timeout")
     
     @patch.dict('os.environ', {'TWILIO_TEST_MODE': 'TRUE'})  # Case insensitive
     def test_test_mode_case_insensitive(self):
         """Test that test mode works with different cases"""
         service = TwilioService()
-        success, message = service.send_otp_sms("+1234567890", "1234")
+        success, message, _ = service.send_otp_sms("+1234567890", "1234")
         
         self.assertTrue(success)
-        self.assertIn("TEST MODE", message)
+        self.assertEqual(message, "TEST MODE simulated")
+        self.mock_client.assert_not_called()
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_empty_phone_number(self, mock_client):
+    def test_send_otp_empty_phone_number(self):
         """Test OTP sending with empty phone number"""
         service = TwilioService()
-        success, message = service.send_otp_sms("", "1234")
+        success, message, _ = service.send_otp_sms("", "1234")
         
-        # Should handle gracefully
+        # Should handle gracefully, without calling Twilio
         self.assertFalse(success)
+        self.assertEqual(message, "Invalid recipient phone number (E.164 required)")
+        self.mock_create.assert_not_called()
     
-    @patch.dict('os.environ', {
-        'TWILIO_ACCOUNT_SID': 'test_sid',
-        'TWILIO_AUTH_TOKEN': 'test_token',
-        'TWILIO_PHONE_NUMBER': '+15005550006'
-    })
-    @patch('users.services.Client')
-    def test_send_otp_rate_limit_error(self, mock_client):
+    def test_send_otp_rate_limit_error(self):
         """Test OTP sending with rate limit error"""
         from twilio.base.exceptions import TwilioRestException
         
-        mock_client.return_value.messages.create.side_effect = TwilioRestException(
+        self.mock_create.side_effect = TwilioRestException(
             status=429,
             uri="/Messages",
             msg="Rate limit exceeded"
         )
         
         service = TwilioService()
-        success, message = service.send_otp_sms("+1234567890", "1234")
+        success, message, _ = service.send_otp_sms("+1234567890", "1234")
         
         self.assertFalse(success)
+        self.assertEqual(message, "Twilio API error sending SMS")
 
+    
+    @patch.dict('os.environ', {'TWILIO_RATE': '1', 'TWILIO_BURST': '1'})
+    def test_send_otp_local_rate_limit(self):
+        """Test client-side throttling rejects sends once the bucket is empty"""
+        mock_message = MagicMock()
+        mock_message.sid = 'test_sid'
+        self.mock_create.return_value = mock_message
+        
+        service = TwilioService()
+        self.assertTrue(service.send_otp_sms("+1234567890", "1234")[0])
+        
+        # Simulate a Twilio 429 so the next send would have to wait past the limit
+        service._bucket.drain(60)
+        success, message, _ = service.send_otp_sms("+1234567890", "1234")
+        
+        self.assertFalse(success)
+        self.assertIn("rate limit", message.lower())
+        self.assertEqual(self.mock_create.call_count, 1)
+    
+    def test_rate_limit_backoff_does_not_stack(self):
+        """Test repeated 429 backoffs share one window instead of adding up"""
+        bucket = TokenBucket(capacity=1, refill_rate=1)
+        
+        bucket.drain(1)
+        bucket.drain(1)
+        
+        self.assertAlmostEqual(bucket.tokens, -1, places=2)
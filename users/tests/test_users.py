@@ -2,7 +2,8 @@
 Tests for user models, views, and serializers.
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -10,8 +11,10 @@ from django.urls import reverse
 
 from users.models import UserProfile
 from users.serializers.user_serializers import UserSerializer, UserCreateSerializer
+from users.tests.helpers import fast_password_hashing
 
 
+@fast_password_hashing
 class UserModelTest(TestCase):
     """Test cases for User and UserProfile models."""
 
@@ -51,6 +54,7 @@ class UserModelTest(TestCase):
         self.assertEqual(str(profile), "Test User (+1234567890)")
 
 
+@fast_password_hashing
 class UserSerializerTest(TestCase):
     """Test cases for user serializers."""
 
@@ -97,63 +101,73 @@ class UserSerializerTest(TestCase):
         self.assertIn('non_field_errors', serializer.errors)
 
 
+@fast_password_hashing
+@override_settings(ROOT_URLCONF='users.tests.urls')
 class UserAPITest(APITestCase):
     """Test cases for user API endpoints."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.admin_user = User.objects.create_superuser(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class in a single INSERT; each test gets its own
+        # copy and rollback. Passwords are pre-hashed with MD5 so
+        # test_change_password_valid can still check the old one.
+        cls.user, cls.admin_user = User.objects.bulk_create([
+            User(
+                username='testuser',
+                email='test@example.com',
+                password=make_password('testpass123', hasher='md5')
+            ),
+            User(
+                username='admin',
+                email='admin@example.com',
+                password=make_password('adminpass123', hasher='md5'),
+                is_staff=True,
+                is_superuser=True
+            ),
+        ])
+        cls.url_current = reverse('users:current-user')
+        cls.url_list = reverse('users:user-list-create')
+        cls.url_change_pw = reverse('users:change-password')
 
     def test_current_user_endpoint_authenticated(self):
         """Test current user endpoint with authenticated user."""
         self.client.force_authenticate(user=self.user)
-        url = reverse('users:current-user')
-        response = self.client.get(url)
+        response = self.client.get(self.url_current)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], 'testuser')
 
     def test_current_user_endpoint_unauthenticated(self):
         """Test current user endpoint without authentication."""
-        url = reverse('users:current-user')
-        response = self.client.get(url)
+        response = self.client.get(self.url_current)
         
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        # SessionAuthentication sends no WWW-Authenticate challenge, so DRF answers 403
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_user_list_admin_access(self):
         """Test user list endpoint with admin access."""
         self.client.force_authenticate(user=self.admin_user)
-        url = reverse('users:user-list-create')
-        response = self.client.get(url)
+        response = self.client.get(self.url_list)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
+        # Paginated by the project-wide PageNumberPagination default
+        self.assertIsInstance(response.data['results'], list)
 
     def test_user_list_regular_user_access(self):
         """Test user list endpoint with regular user access."""
         self.client.force_authenticate(user=self.user)
-        url = reverse('users:user-list-create')
-        response = self.client.get(url)
+        response = self.client.get(self.url_list)
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_change_password_valid(self):
         """Test password change with valid data."""
         self.client.force_authenticate(user=self.user)
-        url = reverse('users:change-password')
         data = {
             'old_password': 'testpass123',
             'new_password': 'newtestpass123'
         }
-        response = self.client.post(url, data)
+        response = self.client.post(self.url_change_pw, data)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -164,12 +178,11 @@ class UserAPITest(APITestCase):
     def test_change_password_invalid_old_password(self):
         """Test password change with invalid old password."""
         self.client.force_authenticate(user=self.user)
-        url = reverse('users:change-password')
         data = {
             'old_password': 'wrongpassword',
             'new_password': 'newtestpass123'
         }
-        response = self.client.post(url, data)
+        response = self.client.post(self.url_change_pw, data)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
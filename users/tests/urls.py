@@ -0,0 +1,20 @@
+"""
+URLconf for the DRF user views under test.
+
+The project URLconf serves the API through FastAPI and no longer routes
+these views, so UserAPITest mounts them here under the ``users`` namespace.
+"""
+
+from django.urls import include, path
+
+from users.views import UserListCreateView, change_password_view, current_user_view
+
+user_patterns = ([
+    path('', UserListCreateView.as_view(), name='user-list-create'),
+    path('me/', current_user_view, name='current-user'),
+    path('change-password/', change_password_view, name='change-password'),
+], 'users')
+
+urlpatterns = [
+    path('api/users/', include(user_patterns)),
+]
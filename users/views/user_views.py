@@ -22,7 +22,8 @@ from users.serializers.user_serializers import (
 class UserListCreateView(generics.ListCreateAPIView):
     """List all users or create a new user."""
     
-    queryset = User.objects.all()
+    # Listing renders UserSerializer, so leave password and the rest unloaded
+    queryset = User.objects.only(*UserSerializer.Meta.fields)
     permission_classes = [permissions.IsAuthenticated]
     
     def get_serializer_class(self):
@@ -40,7 +41,8 @@ class UserListCreateView(generics.ListCreateAPIView):
 class UserRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update or delete a user."""
     
-    queryset = User.objects.all()
+    # UserWithProfileSerializer renders the profile; join it in the same query
+    queryset = User.objects.select_related('profile')
     permission_classes = [permissions.IsAuthenticated]
     
     def get_serializer_class(self):
@@ -56,18 +58,19 @@ class UserRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     
     def get_object(self):
         """Ensure users can only access their own profile unless they're staff."""
-        obj = super().get_object()
         user = self.request.user
+        # Compare the URL's pk before loading anything, so denied requests never hit the DB
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
         
-        if not user.is_staff and obj != user:
+        if not user.is_staff and str(lookup) != str(user.pk):
             self.permission_denied(self.request, message="You can only access your own profile.")
         
-        return obj
+        return super().get_object()
     
     def perform_destroy(self, instance):
         """Soft delete by deactivating user."""
         instance.is_active = False
-        instance.save()
+        instance.save(update_fields=['is_active'])
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -78,11 +81,17 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         """Get or create profile for the current user."""
-        profile, created = UserProfile.objects.get_or_create(
-            user=self.request.user,
-            defaults={}
-        )
-        return profile
+        # The reverse accessor caches the profile on request.user, so repeat
+        # calls within a request (and the common existing-profile case) cost
+        # at most one SELECT; only a missing profile falls back to creating it.
+        try:
+            return self.request.user.profile
+        except UserProfile.DoesNotExist:
+            profile, created = UserProfile.objects.get_or_create(
+                user=self.request.user,
+                defaults={}
+            )
+            return profile
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
@@ -125,7 +134,7 @@ def change_password_view(request):
         )
     
     user.set_password(new_password)
-    user.save()
+    user.save(update_fields=['password'])
     
     return Response({'message': 'Password changed successfully.'})
 
@@ -136,7 +145,7 @@ def activate_user_view(request, user_id):
     """Activate a deactivated user (admin only)."""
     user = get_object_or_404(User, id=user_id)
     user.is_active = True
-    user.save()
+    user.save(update_fields=['is_active'])
     
     return Response({'message': f'User {user.username} activated successfully.'})
 
@@ -154,6 +163,6 @@ def deactivate_user_view(request, user_id):
         )
     
     user.is_active = False
-    user.save()
+    user.save(update_fields=['is_active'])
     
     return Response({'message': f'User {user.username} deactivated successfully.'})